@@ -0,0 +1,42 @@
+"""Benchmark input files shared by the benchmark modules.
+
+Environment variables:
+    BENCH_TXC_FILE: TransXChange file to benchmark (default: sample.xml in
+        the repository root).
+    BENCH_REFRESH_STAT: set to 1 if the TXC file may be (re)generated while
+        the benchmarks run.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+TXC_FILE = Path(os.environ.get("BENCH_TXC_FILE", Path(__file__).parent.parent / "sample.xml"))
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+# Stat the TXC file once rather than on every check; set BENCH_REFRESH_STAT=1
+# if the file may be (re)generated while the benchmarks run.
+_TXC_STAT = _stat(TXC_FILE)
+
+
+def _txc_stat() -> Optional[os.stat_result]:
+    if os.environ.get("BENCH_REFRESH_STAT") == "1":
+        return _stat(TXC_FILE)
+    return _TXC_STAT
+
+
+def _txc_exists() -> bool:
+    return _txc_stat() is not None
+
+
+def _txc_size() -> int:
+    """Size of the TXC file in bytes, or 0 if it does not exist."""
+    st = _txc_stat()
+    return st.st_size if st is not None else 0
@@ -0,0 +1,96 @@
+"""Reduce environmental noise before running benchmarks.
+
+CPU frequency scaling, turbo boost and the scheduler moving the process
+between cores are the largest sources of run-to-run variance. ``stabilize``
+fixes what an unprivileged process can (CPU affinity, priority) and warns
+about the rest. Everything is best-effort: unsupported platforms such as
+macOS simply skip the corresponding step.
+
+Environment variables:
+    BENCH_CPU: comma-separated cores to pin the benchmark process to
+        (default: keep the current affinity mask). The GTFS reader and
+        writer parallelise over a rayon thread pool, so pinning to a
+        single core measures them single-threaded; give several cores to
+        pin while keeping that parallelism.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+CPUFREQ_DIR = Path("/sys/devices/system/cpu/cpu0/cpufreq")
+NO_TURBO = Path("/sys/devices/system/cpu/intel_pstate/no_turbo")
+BOOST = Path("/sys/devices/system/cpu/cpufreq/boost")
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def pin_cpu() -> Optional[set[int]]:
+    """Pin this process to ``BENCH_CPU``.
+
+    Returns the cores, or None if ``BENCH_CPU`` is unset or pinning is
+    unsupported, in which case the current affinity mask is kept.
+    """
+    requested = os.environ.get("BENCH_CPU")
+    if not requested or not hasattr(os, "sched_setaffinity"):
+        return None
+
+    cpus = {int(cpu) for cpu in requested.split(",")}
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        print(f"  warning: could not pin to CPUs {sorted(cpus)}: {e}")
+        return None
+    return cpus
+
+
+def raise_priority(increment: int = -5) -> bool:
+    """Raise scheduling priority; needs elevated privileges to succeed."""
+    try:
+        os.nice(increment)
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+def check_frequency_scaling() -> list[str]:
+    """Return warnings about CPU frequency settings that add timing noise."""
+    warnings = []
+
+    governor = _read(CPUFREQ_DIR / "scaling_governor")
+    if governor is not None and governor != "performance":
+        warnings.append(
+            f"CPU governor is {governor!r}; "
+            "set it with `sudo cpupower frequency-set -g performance`"
+        )
+
+    if _read(NO_TURBO) == "0" or _read(BOOST) == "1":
+        warnings.append(
+            "turbo boost is enabled; disable it via "
+            f"`echo 1 | sudo tee {NO_TURBO}` (Intel) or `echo 0 | sudo tee {BOOST}`"
+        )
+
+    return warnings
+
+
+def stabilize(pin: bool = True):
+    """Pin, prioritise and check the CPU before a benchmark run.
+
+    Pass ``pin=False`` to ignore ``BENCH_CPU`` and keep the current CPU
+    affinity, e.g. when running benchmarks in parallel processes.
+    """
+    cpus = pin_cpu() if pin else None
+    if cpus is not None:
+        print(f"Pinned to CPUs {sorted(cpus)}")
+    elif hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        print(f"Running on CPUs {cpus} (set BENCH_CPU to pin)")
+    if not raise_priority():
+        print("  note: could not raise priority (needs root); running at normal priority")
+    for warning in check_frequency_scaling():
+        print(f"  warning: {warning}")
@@ -1,8 +1,12 @@
 """Benchmarks for TXC parsing comparing transit-parser against other libraries."""
 
-import os
+import argparse
+import fnmatch
+import functools
+import statistics
 import tempfile
 import time
+from collections.abc import Sequence
 from pathlib import Path
 
 import pytest
@@ -10,19 +14,49 @@ import pytest
 # Our library
 from transit_parser import TxcDocument, TxcToGtfsConverter, ConversionOptions
 
-# Test file - set via BENCH_TXC_FILE env var or use default
-TXC_FILE = Path(os.environ.get("BENCH_TXC_FILE", Path(__file__).parent.parent / "sample.xml"))
+try:
+    from ._data import TXC_FILE, _txc_exists, _txc_size
+    from .run_benchmarks import format_ms
+except ImportError:  # run as a script from benchmarks/
+    from _data import TXC_FILE, _txc_exists, _txc_size
+    from run_benchmarks import format_ms
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_parse(path: str) -> TxcDocument:
+    """Parse a TXC file once and share the document between benchmarks."""
+    return TxcDocument.from_path(path)
+
+
+def lxml_count_services(path: str) -> int:
+    """Stream-parse a TXC file with lxml, counting Service elements.
+
+    Uses the iterparse "fast iter" pattern: each Service is cleared and its
+    already-processed siblings dropped, so memory stays bounded by depth
+    rather than document size.
+    """
+    from lxml import etree
+
+    count = 0
+    tags = ("{http://www.transxchange.org.uk/}Service", "Service")
+    for _, elem in etree.iterparse(path, events=("end",), tag=tags):
+        count += 1
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return count
 
 
 def check_file_exists():
     """Check if test file exists."""
-    if not TXC_FILE.exists():
+    if not _txc_exists():
         pytest.skip(f"Test file not found: {TXC_FILE}")
 
 
 class TestTransitParserBenchmarks:
     """Benchmarks for transit-parser (our Rust-backed library)."""
 
+    @pytest.mark.benchmark(group="TXC parsing")
     def test_txc_parse(self, benchmark):
         """Benchmark TXC document parsing."""
         check_file_exists()
@@ -30,10 +64,11 @@ class TestTransitParserBenchmarks:
         assert result.service_count > 0
         assert result.vehicle_journey_count > 0
 
+    @pytest.mark.benchmark(group="TXC to GTFS conversion")
     def test_txc_to_gtfs_conversion(self, benchmark):
         """Benchmark TXC to GTFS conversion."""
         check_file_exists()
-        doc = TxcDocument.from_path(str(TXC_FILE))
+        doc = _cached_parse(str(TXC_FILE))
         options = ConversionOptions(
             include_shapes=False,
             region="england",
@@ -46,6 +81,7 @@ class TestTransitParserBenchmarks:
         assert result.stats.trips_converted > 0
         assert result.stats.stop_times_generated > 0
 
+    @pytest.mark.benchmark(group="TXC to GTFS full pipeline")
     def test_full_pipeline(self, benchmark):
         """Benchmark full parse + convert pipeline."""
         check_file_exists()
@@ -70,19 +106,21 @@ try:
     class TestTransx2GtfsBenchmarks:
         """Benchmarks for transx2gtfs library."""
 
-        def test_transx2gtfs_parse_and_convert(self, benchmark):
+        @pytest.mark.benchmark(group="TXC to GTFS full pipeline")
+        def test_transx2gtfs_parse_and_convert(self, benchmark, tmp_path):
             """Benchmark transx2gtfs full pipeline."""
+            benchmark.extra_info["library"] = "transx2gtfs"
             check_file_exists()
+            output_path = tmp_path / "output.zip"
 
             def parse_and_convert():
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    output_path = Path(tmpdir) / "output.zip"
-                    try:
-                        transx2gtfs.convert(str(TXC_FILE), str(output_path))
-                        return output_path.exists()
-                    except Exception as e:
-                        # transx2gtfs may fail on some files
-                        return str(e)
+                output_path.unlink(missing_ok=True)
+                try:
+                    transx2gtfs.convert(str(TXC_FILE), str(output_path))
+                    return output_path.exists()
+                except Exception as e:
+                    # transx2gtfs may fail on some files
+                    return str(e)
 
             result = benchmark(parse_and_convert)
 
@@ -92,24 +130,18 @@ except ImportError:
 
 # Compare against lxml for raw XML parsing baseline
 try:
-    from lxml import etree
+    import lxml  # noqa: F401
 
     class TestLxmlBaseline:
         """Baseline comparison using lxml for XML parsing."""
 
+        @pytest.mark.benchmark(group="TXC parsing")
         def test_lxml_parse(self, benchmark):
             """Benchmark raw XML parsing with lxml."""
+            benchmark.extra_info["library"] = "lxml"
             check_file_exists()
 
-            def parse_xml():
-                tree = etree.parse(str(TXC_FILE))
-                root = tree.getroot()
-                # Count some elements to ensure parsing happened
-                ns = {"txc": "http://www.transxchange.org.uk/"}
-                services = root.findall(".//txc:Service", ns) or root.findall(".//Service")
-                return len(services) if services else len(root)
-
-            result = benchmark(parse_xml)
+            result = benchmark(lxml_count_services, str(TXC_FILE))
             assert result > 0
 
 except ImportError:
@@ -117,73 +149,87 @@ except ImportError:
 
 
 # Manual timing for quick comparison
-def run_manual_benchmark():
-    """Run a manual benchmark without pytest-benchmark."""
-    if not TXC_FILE.exists():
-        print(f"Test file not found: {TXC_FILE}")
-        return
+def _time_calls(func, iterations: int, warmup: int) -> list[float]:
+    """Call ``func`` ``warmup`` times untimed, then return ``iterations`` timings."""
+    for _ in range(warmup):
+        func()
 
-    print(f"Benchmarking with file: {TXC_FILE}")
-    print(f"File size: {TXC_FILE.stat().st_size / 1024 / 1024:.2f} MB")
-    print()
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
 
-    iterations = 5
 
-    # ============================================
-    # transit-parser benchmarks
-    # ============================================
-    print("=" * 60)
-    print("transit-parser (Rust)")
-    print("=" * 60)
+def summary(times: list[float]) -> tuple[float, float, float, float]:
+    """Return the mean, median, sample standard deviation and minimum of ``times``."""
+    stdev = statistics.stdev(times) if len(times) > 1 else 0.0
+    return statistics.mean(times), statistics.median(times), stdev, min(times)
 
-    # Warm up
-    _ = TxcDocument.from_path(str(TXC_FILE))
 
-    # Parse benchmark
-    parse_times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        doc = TxcDocument.from_path(str(TXC_FILE))
-        parse_times.append(time.perf_counter() - start)
+def _print_stats(title: str, times: list[float]) -> float:
+    """Print the summary of ``times`` under ``title`` and return the mean."""
+    mean, median, stdev, fastest = summary(times)
+    print(f"{title}:")
+    print(f"  Mean:   {format_ms(mean * 1000)}")
+    print(f"  Median: {format_ms(median * 1000)} ± {format_ms(stdev * 1000)}")
+    print(f"  Min:    {format_ms(fastest * 1000)}")
+    return mean
 
-    print("TXC Parsing:")
-    print(f"  Mean: {sum(parse_times) / len(parse_times) * 1000:.2f} ms")
-    print(f"  Min:  {min(parse_times) * 1000:.2f} ms")
 
-    # Conversion benchmark
+def _manual_converter() -> TxcToGtfsConverter:
     options = ConversionOptions(
         include_shapes=False,
         region="england",
         calendar_start="2025-04-28",
         calendar_end="2025-12-31",
     )
-    converter = TxcToGtfsConverter(options)
+    return TxcToGtfsConverter(options)
 
-    convert_times = []
-    for _ in range(iterations):
-        doc = TxcDocument.from_path(str(TXC_FILE))
-        start = time.perf_counter()
-        result = converter.convert(doc)
-        convert_times.append(time.perf_counter() - start)
 
-    print("TXC to GTFS Conversion:")
-    print(f"  Mean: {sum(convert_times) / len(convert_times) * 1000:.2f} ms")
-    print(f"  Min:  {min(convert_times) * 1000:.2f} ms")
+def _print_header(title: str):
+    print("=" * 60)
+    print(title)
+    print("=" * 60)
 
-    # Full pipeline benchmark
-    full_times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        doc = TxcDocument.from_path(str(TXC_FILE))
-        result = converter.convert(doc)
-        full_times.append(time.perf_counter() - start)
 
-    print("Full Pipeline (Parse + Convert):")
-    print(f"  Mean: {sum(full_times) / len(full_times) * 1000:.2f} ms")
-    print(f"  Min:  {min(full_times) * 1000:.2f} ms")
+def bench_parse(iterations: int, warmup: int, results: dict) -> dict[str, list[float]]:
+    """Time TxcDocument.from_path."""
+    _print_header("transit-parser (Rust): parse")
+    parse_times = _time_calls(lambda: TxcDocument.from_path(str(TXC_FILE)), iterations, warmup)
+
+    _print_stats("TXC Parsing", parse_times)
+    print()
+    return {"parse": parse_times}
+
 
-    our_full_mean = sum(full_times) / len(full_times)
+def bench_convert(iterations: int, warmup: int, results: dict) -> dict[str, list[float]]:
+    """Time TXC to GTFS conversion of an already-parsed document."""
+    _print_header("transit-parser (Rust): convert")
+    converter = _manual_converter()
+    doc = _cached_parse(str(TXC_FILE))
+    convert_times = _time_calls(lambda: converter.convert(doc), iterations, warmup)
 
+    _print_stats("TXC to GTFS Conversion", convert_times)
+    print()
+    return {"convert": convert_times}
+
+
+def bench_full(iterations: int, warmup: int, results: dict) -> dict[str, list[float]]:
+    """Time the parse + convert pipeline."""
+    _print_header("transit-parser (Rust): full pipeline")
+    converter = _manual_converter()
+
+    def full_pipeline():
+        return converter.convert(TxcDocument.from_path(str(TXC_FILE)))
+
+    full_times = _time_calls(full_pipeline, iterations, warmup)
+
+    _print_stats("Full Pipeline (Parse + Convert)", full_times)
+
+    doc = _cached_parse(str(TXC_FILE))
+    result = converter.convert(doc)
     print()
     print("Conversion Results:")
     print(f"  Services:    {doc.service_count}")
@@ -191,107 +237,135 @@ def run_manual_benchmark():
     print(f"  Trips:       {result.stats.trips_converted}")
     print(f"  Stop times:  {result.stats.stop_times_generated}")
     print()
+    return {"full": full_times}
 
-    # ============================================
-    # transx2gtfs benchmarks
-    # ============================================
-    try:
-        import transx2gtfs
 
-        print("=" * 60)
-        print("transx2gtfs (Python)")
-        print("=" * 60)
+def _print_speedup(label: str, reference: str, other_mean: float, results: dict):
+    """Print a speedup against a transit-parser result from this same run."""
+    if reference not in results:
+        print(f"(Run '{reference}' in the same invocation to compare against {label})")
+        return
+    ours_mean = summary(results[reference])[0]
+    print(f"Speedup vs {label}: {other_mean / ours_mean:.1f}x faster")
 
-        transx2gtfs_times = []
-        for i in range(iterations):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = Path(tmpdir) / "output.zip"
-                start = time.perf_counter()
-                try:
-                    transx2gtfs.convert(str(TXC_FILE), str(output_path))
-                    transx2gtfs_times.append(time.perf_counter() - start)
-                except Exception as e:
-                    if i == 0:
-                        print(f"  Error: {e}")
-                    transx2gtfs_times.append(time.perf_counter() - start)
-
-        if transx2gtfs_times:
-            transx2gtfs_mean = sum(transx2gtfs_times) / len(transx2gtfs_times)
-            print("Full Pipeline (Parse + Convert):")
-            print(f"  Mean: {transx2gtfs_mean * 1000:.2f} ms")
-            print(f"  Min:  {min(transx2gtfs_times) * 1000:.2f} ms")
-            print()
-            print(f"Speedup vs transx2gtfs: {transx2gtfs_mean / our_full_mean:.1f}x faster")
-        print()
 
+def bench_vs_transx2gtfs(iterations: int, warmup: int, results: dict) -> dict[str, list[float]]:
+    """Time transx2gtfs's full conversion, if installed."""
+    try:
+        import transx2gtfs
     except ImportError:
         print("transx2gtfs not installed, skipping comparison")
         print("  Install with: pip install transx2gtfs")
         print()
+        return {}
 
-    # ============================================
-    # lxml baseline (raw XML parsing)
-    # ============================================
-    try:
-        from lxml import etree
-
-        print("=" * 60)
-        print("lxml baseline (raw XML parsing only)")
-        print("=" * 60)
-
-        lxml_times = []
-        for _ in range(iterations):
-            start = time.perf_counter()
-            tree = etree.parse(str(TXC_FILE))
-            root = tree.getroot()
-            lxml_times.append(time.perf_counter() - start)
-
-        lxml_mean = sum(lxml_times) / len(lxml_times)
-        print("XML Parsing:")
-        print(f"  Mean: {lxml_mean * 1000:.2f} ms")
-        print(f"  Min:  {min(lxml_times) * 1000:.2f} ms")
-        print()
-        print(f"Our parse vs lxml: {sum(parse_times) / len(parse_times) / lxml_mean:.1f}x slower")
-        print("  (Note: lxml only parses XML, we also extract structured data)")
+    _print_header("transx2gtfs (Python)")
+
+    transx2gtfs_times = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "output.zip"
+
+        def transx2gtfs_convert():
+            output_path.unlink(missing_ok=True)
+            transx2gtfs.convert(str(TXC_FILE), str(output_path))
+
+        try:
+            transx2gtfs_times = _time_calls(transx2gtfs_convert, iterations, warmup)
+        except Exception as e:
+            print(f"  Error: {e}")
+
+    if transx2gtfs_times:
+        transx2gtfs_mean = _print_stats("Full Pipeline (Parse + Convert)", transx2gtfs_times)
         print()
+        _print_speedup("transx2gtfs", "full", transx2gtfs_mean, results)
+    print()
+    return {"transx2gtfs": transx2gtfs_times}
+
 
+def bench_vs_lxml(iterations: int, warmup: int, results: dict) -> dict[str, list[float]]:
+    """Time a streaming lxml parse as a raw XML baseline, if installed."""
+    try:
+        import lxml  # noqa: F401
     except ImportError:
         print("lxml not installed, skipping baseline")
         print()
+        return {}
 
-    # ============================================
-    # pytxc comparison (if available)
-    # ============================================
-    try:
-        import pytxc
+    _print_header("lxml baseline (raw XML parsing only)")
+    lxml_times = _time_calls(lambda: lxml_count_services(str(TXC_FILE)), iterations, warmup)
 
-        print("=" * 60)
-        print("pytxc (Python)")
-        print("=" * 60)
-
-        pytxc_times = []
-        for _ in range(iterations):
-            start = time.perf_counter()
-            try:
-                txc = pytxc.Timetable.from_file(str(TXC_FILE))
-                pytxc_times.append(time.perf_counter() - start)
-            except Exception as e:
-                print(f"  Error: {e}")
-                break
-
-        if pytxc_times:
-            pytxc_mean = sum(pytxc_times) / len(pytxc_times)
-            print("TXC Parsing:")
-            print(f"  Mean: {pytxc_mean * 1000:.2f} ms")
-            print(f"  Min:  {min(pytxc_times) * 1000:.2f} ms")
-            print()
-            print(f"Speedup vs pytxc: {pytxc_mean / (sum(parse_times) / len(parse_times)):.1f}x faster")
-        print()
+    _print_stats("XML Parsing (iterparse)", lxml_times)
+    print()
+    return {"lxml": lxml_times}
 
+
+def bench_vs_pytxc(iterations: int, warmup: int, results: dict) -> dict[str, list[float]]:
+    """Time pytxc parsing, if installed."""
+    try:
+        import pytxc
     except ImportError:
         print("pytxc not installed (requires Python <3.12 due to shapely dependency)")
         print()
+        return {}
+
+    _print_header("pytxc (Python)")
+
+    pytxc_times = []
+    try:
+        pytxc_times = _time_calls(
+            lambda: pytxc.Timetable.from_file(str(TXC_FILE)), iterations, warmup
+        )
+    except Exception as e:
+        print(f"  Error: {e}")
+
+    if pytxc_times:
+        pytxc_mean = _print_stats("TXC Parsing", pytxc_times)
+        print()
+        _print_speedup("pytxc", "parse", pytxc_mean, results)
+    print()
+    return {"pytxc": pytxc_times}
+
+
+# Run in this order so comparisons can use the transit-parser results
+MANUAL_BENCHMARKS = {
+    "parse": bench_parse,
+    "convert": bench_convert,
+    "full": bench_full,
+    "transx2gtfs": bench_vs_transx2gtfs,
+    "lxml": bench_vs_lxml,
+    "pytxc": bench_vs_pytxc,
+}
+
+
+def run_manual_benchmark(only: Sequence[str] = ("*",), iterations: int = 5, warmup: int = 1):
+    """Run a manual benchmark without pytest-benchmark.
+
+    ``only`` holds glob patterns selecting entries of ``MANUAL_BENCHMARKS``.
+    Comparisons are only printed against results from the same run.
+    """
+    if not _txc_exists():
+        print(f"Test file not found: {TXC_FILE}")
+        return
+
+    print(f"Benchmarking with file: {TXC_FILE}")
+    print(f"File size: {_txc_size() / 1024 / 1024:.2f} MB")
+    print()
+
+    results: dict[str, list[float]] = {}
+    for name, bench in MANUAL_BENCHMARKS.items():
+        if any(fnmatch.fnmatch(name, pattern) for pattern in only):
+            results.update(bench(iterations, warmup, results))
 
 
 if __name__ == "__main__":
-    run_manual_benchmark()
+    parser = argparse.ArgumentParser(description="Manual TXC parsing benchmarks.")
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="PATTERN",
+        help=f"run matching benchmarks only (repeatable): {', '.join(MANUAL_BENCHMARKS)}",
+    )
+    parser.add_argument("--iterations", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per benchmark")
+    args = parser.parse_args()
+    run_manual_benchmark(args.only or ("*",), args.iterations, args.warmup)
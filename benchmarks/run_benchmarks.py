@@ -8,64 +8,139 @@ Usage:
 
 Or with uv:
     uv run python benchmarks/run_benchmarks.py
+
+Raw timings are saved to benchmarks/results/; compare against an earlier run with:
+    python benchmarks/run_benchmarks.py --baseline <git sha>
+
+To build the report from a pytest-benchmark run instead:
+    pytest benchmarks/ --benchmark-only --benchmark-json=out.json
+    python benchmarks/run_benchmarks.py --from-json out.json
 """
 
+import argparse
+import hashlib
+import inspect
+import io
+import json
+import multiprocessing
 import os
+import platform
+import shutil
+import statistics
+import subprocess
 import sys
 import time
+import timeit
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    from ._data import TXC_FILE, _txc_exists, _txc_size, _txc_stat
+    from .bench_env import stabilize
+except ImportError:  # run as a script from benchmarks/
+    from _data import TXC_FILE, _txc_exists, _txc_size, _txc_stat
+    from bench_env import stabilize
+
 
 # ============================================
 # Configuration
 # ============================================
 
 ITERATIONS = 5
-WARMUP_ITERATIONS = 1
+MAX_WARMUP_ITERATIONS = 10
+WARMUP_WINDOW = 3  # Recent warmup runs that must agree before timing starts
+WARMUP_TOLERANCE = 1.05  # Max/min ratio across the window counted as stable
+MAX_COV = 0.05  # Coefficient of variation above which a measurement is retried
+MAX_ATTEMPTS = 3
 GTFS_DIR = Path(os.environ.get("BENCH_GTFS_DIR", Path(__file__).parent.parent / "gtfs_output"))
-TXC_FILE = Path(os.environ.get("BENCH_TXC_FILE", Path(__file__).parent.parent / "sample.xml"))
 BENCH_MD = Path(__file__).parent / "BENCH.md"
+RESULTS_JSON = Path(__file__).parent / "results.json"
+RESULTS_DIR = Path(__file__).parent / "results"
+# Options for converting TXC_FILE into the GTFS_DIR test feed
+TEST_DATA_OPTIONS = {"include_shapes": False, "region": "england"}
+TEST_DATA_MANIFEST = ".fixture_manifest"
 
 
 # ============================================
 # Data structures
 # ============================================
 
-@dataclass
+def format_ms(value: float) -> str:
+    """Format a duration in milliseconds with a readable unit and precision."""
+    if value < 0.01:
+        return f"{value * 1000:.2f} µs"
+    elif value < 1:
+        return f"{value:.3f} ms"
+    else:
+        return f"{value:.2f} ms"
+
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class BenchResult:
     """Result of a single benchmark."""
     name: str
     library: str
     category: str
     mean_ms: float
+    median_ms: float
     min_ms: float
     max_ms: float
+    stddev_ms: float = 0.0
+    times: tuple[float, ...] = ()  # Raw per-call samples in ms
+    unreliable: bool = False  # Still noisy after MAX_ATTEMPTS measurements
     unit: str = "ms"
 
+    @classmethod
+    def from_stats(cls, name: str, library: str, stats: dict, **extra) -> "BenchResult":
+        """Build a result from the timing dict returned by run_timed."""
+        return cls(
+            name=name,
+            library=library,
+            mean_ms=stats["mean"],
+            median_ms=stats["median"],
+            min_ms=stats["min"],
+            max_ms=stats["max"],
+            stddev_ms=stats["stddev"],
+            times=tuple(stats["times"]),
+            unreliable=stats["unreliable"],
+            **extra,
+        )
+
     @property
-    def display_mean(self) -> str:
-        if self.mean_ms < 0.01:
-            return f"{self.mean_ms * 1000:.2f} µs"
-        elif self.mean_ms < 1:
-            return f"{self.mean_ms:.3f} ms"
-        else:
-            return f"{self.mean_ms:.2f} ms"
+    def display_median(self) -> str:
+        return format_ms(self.median_ms)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BenchCategory:
     """Category of benchmarks for comparison."""
     name: str
     description: str
     results: list[BenchResult] = field(default_factory=list)
+    _sorted: Optional[list[BenchResult]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add(self, result: BenchResult):
         self.results.append(result)
+        self._sorted = None
 
-    def sorted_by_mean(self) -> list[BenchResult]:
-        return sorted(self.results, key=lambda r: r.mean_ms)
+    def sorted_by_median(self) -> list[BenchResult]:
+        """Results from fastest to slowest; computed once until the next ``add``."""
+        if self._sorted is None:
+            self._sorted = sorted(self.results, key=lambda r: r.median_ms)
+        return self._sorted
+
+
+# Raw samples of a saved run, keyed by (category, library, name)
+Baseline = dict[tuple[str, str, str], tuple[float, ...]]
 
 
 # ============================================
@@ -81,101 +156,456 @@ def ascii_bar(value: float, max_value: float, width: int = 40, char: str = "█"
     return char * filled
 
 
+MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+
 def format_bar_chart(results: list[BenchResult], width: int = 40) -> str:
     """Format results as an ASCII bar chart."""
     if not results:
         return "  No results"
 
-    max_mean = max(r.mean_ms for r in results)
-    max_name_len = max(len(f"{r.library} ({r.name})") for r in results)
-
-    lines = []
-    for i, r in enumerate(results):
-        rank = i + 1
-        name = f"{r.library} ({r.name})"
-        bar = ascii_bar(r.mean_ms, max_mean, width)
-
-        # Add ranking medal
-        medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(rank, f" {rank}.")
+    max_median, max_name_len = 0.0, 0
+    for r in results:
+        max_median = max(max_median, r.median_ms)
+        max_name_len = max(max_name_len, len(r.library) + len(r.name) + 3)
 
-        lines.append(f"  {medal} {name:<{max_name_len}}  {bar}  {r.display_mean}")
+    return "\n".join(
+        f"  {MEDALS.get(rank, f' {rank}.')} {f'{r.library} ({r.name})':<{max_name_len}}"
+        f"  {ascii_bar(r.median_ms, max_median, width)}  {r.display_median}"
+        for rank, r in enumerate(results, 1)
+    )
 
-    return "\n".join(lines)
 
+def format_comparison_table(results: list[BenchResult], baseline: Optional[Baseline] = None) -> str:
+    """Format results, sorted fastest first, as a markdown table.
 
-def format_comparison_table(results: list[BenchResult]) -> str:
-    """Format results as a markdown table."""
+    Adds a delta column when given a baseline.
+    """
     if not results:
         return ""
 
-    # Find the fastest result
-    fastest = min(results, key=lambda r: r.mean_ms)
+    fastest = results[0]
 
     lines = [
-        "| Rank | Library | Operation | Mean | Min | vs Fastest |",
-        "|------|---------|-----------|------|-----|------------|",
+        "| Rank | Library | Operation | Median ± Stddev | Min | vs Fastest |",
+        "|------|---------|-----------|-----------------|-----|------------|",
     ]
+    if baseline is not None:
+        lines[0] += " vs Baseline |"
+        lines[1] += "-------------|"
 
-    for i, r in enumerate(sorted(results, key=lambda r: r.mean_ms)):
-        rank = i + 1
-        speedup = r.mean_ms / fastest.mean_ms if fastest.mean_ms > 0 else 1
+    for rank, r in enumerate(results, 1):
+        speedup = r.median_ms / fastest.median_ms if fastest.median_ms > 0 else 1
         speedup_str = "baseline" if speedup == 1 else f"{speedup:.2f}x slower"
 
-        lines.append(
-            f"| {rank} | {r.library} | {r.name} | {r.display_mean} | "
-            f"{r.min_ms:.2f} ms | {speedup_str} |"
+        name = f"{r.name} ⚠️" if r.unreliable else r.name
+        line = (
+            f"| {rank} | {r.library} | {name} | "
+            f"{r.display_median} ± {format_ms(r.stddev_ms)} | "
+            f"{format_ms(r.min_ms)} | {speedup_str} |"
         )
+        if baseline is not None:
+            line += f" {format_baseline_delta(r, baseline)} |"
+        lines.append(line)
 
     return "\n".join(lines)
 
 
+def format_baseline_delta(result: BenchResult, baseline: Baseline) -> str:
+    """Describe the change in median against a saved run.
+
+    Includes a Mann-Whitney U p-value when scipy is installed, so a delta
+    can be told apart from run-to-run noise.
+    """
+    previous = baseline.get((result.category, result.library, result.name))
+    if not previous:
+        return "n/a"
+
+    delta = (result.median_ms / statistics.median(previous) - 1) * 100
+    text = f"{delta:+.1f}%"
+
+    try:
+        from scipy.stats import mannwhitneyu
+    except ImportError:
+        return text
+    if result.times:
+        pvalue = mannwhitneyu(result.times, previous, alternative="two-sided").pvalue
+        text += f" (p={pvalue:.3f})"
+    return text
+
+
+# ============================================
+# Result Persistence
+# ============================================
+
+def git_sha() -> str:
+    """Return the checked-out commit, or "unknown" outside a git checkout."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def cpu_model() -> str:
+    """Return a human-readable CPU model name."""
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            if line.startswith("model name"):
+                return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_info() -> dict:
+    """Describe the host in the shape of pytest-benchmark's ``machine_info``."""
+    uname = platform.uname()
+    cpu = {"brand_raw": cpu_model(), "count": os.cpu_count()}
+    try:
+        import psutil
+    except ImportError:
+        pass
+    else:
+        freq = psutil.cpu_freq()
+        if freq is not None:
+            cpu["hz_actual_friendly"] = f"{freq.current:.0f} MHz"
+            cpu["hz_advertised_friendly"] = f"{freq.max:.0f} MHz"
+
+    return {
+        "node": uname.node,
+        "processor": uname.processor,
+        "machine": uname.machine,
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "release": uname.release,
+        "system": uname.system,
+        "cpu": cpu,
+    }
+
+
+def write_json_report(categories: list[BenchCategory], path: Path = RESULTS_JSON):
+    """Write results in pytest-benchmark's JSON format.
+
+    Tools that consume ``pytest --benchmark-json`` output (such as
+    github-action-benchmark) can read it as-is, and ``--from-json`` loads
+    it back. Times are in seconds, as in pytest-benchmark.
+    """
+    benchmarks = []
+    for cat in categories:
+        for r in cat.results:
+            benchmarks.append({
+                "group": cat.name,
+                "name": r.name,
+                "fullname": f"{Path(__file__).name}::{r.library}::{r.name}",
+                "params": None,
+                "extra_info": {
+                    "library": r.library,
+                    "category": r.category,
+                    "unreliable": r.unreliable,
+                },
+                "stats": {
+                    "min": r.min_ms / 1000,
+                    "max": r.max_ms / 1000,
+                    "mean": r.mean_ms / 1000,
+                    "stddev": r.stddev_ms / 1000,
+                    "median": r.median_ms / 1000,
+                    "rounds": len(r.times),
+                    "ops": 1000 / r.mean_ms if r.mean_ms > 0 else 0.0,
+                    "data": [t / 1000 for t in r.times],
+                },
+            })
+
+    data = {
+        "machine_info": machine_info(),
+        "commit_info": {"id": git_sha()},
+        "datetime": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": benchmarks,
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def save_results(categories: list[BenchCategory]) -> Path:
+    """Write the raw timings of this run to ``RESULTS_DIR``."""
+    sha = git_sha()
+    timestamp = time.strftime("%Y%m%dT%H%M%S")
+    data = {
+        "git_sha": sha,
+        "hostname": platform.node(),
+        "cpu_model": cpu_model(),
+        "timestamp": timestamp,
+        "results": [
+            {"category": r.category, "library": r.library, "name": r.name, "times": r.times}
+            for cat in categories
+            for r in cat.results
+        ],
+    }
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    path = RESULTS_DIR / f"{sha}_{timestamp}.json"
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+def load_baseline(sha: str) -> Baseline:
+    """Load the most recent saved run whose commit starts with ``sha``."""
+    candidates = sorted(RESULTS_DIR.glob(f"{sha}*_*.json"))
+    if not candidates:
+        raise SystemExit(f"No saved results for {sha!r} in {RESULTS_DIR}")
+
+    data = json.loads(candidates[-1].read_text())
+    return {
+        (r["category"], r["library"], r["name"]): tuple(r["times"])
+        for r in data["results"]
+    }
+
+
 # ============================================
 # Benchmark Functions
 # ============================================
 
-def run_timed(func, iterations: int = ITERATIONS, warmup: int = WARMUP_ITERATIONS):
-    """Run a function multiple times and return timing stats."""
-    # Warmup
-    for _ in range(warmup):
-        func()
+def run_timed(
+    stmt,
+    iterations: int = ITERATIONS,
+    warmup: Optional[int] = None,
+    namespace: Optional[dict] = None,
+):
+    """Run a function multiple times and return timing stats.
+
+    ``stmt`` is a callable or a statement string evaluated in ``namespace``.
+    A string is compiled straight into timeit's loop, avoiding the extra
+    Python call per iteration, which matters for µs-scale operations.
+
+    Each sample times a calibrated loop of calls (``timeit.autorange``) so
+    fast operations are not swamped by timer resolution or loop overhead.
 
-    # Timed runs
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        times.append((time.perf_counter() - start) * 1000)  # Convert to ms
+    With ``warmup=None`` the function is warmed up until the last few runs
+    agree within ``WARMUP_TOLERANCE`` (at most ``MAX_WARMUP_ITERATIONS``);
+    pass an explicit count for workloads known to need a longer warmup.
+    """
+    timer = timeit.Timer(stmt, globals=namespace)
+
+    # Warmup
+    warmup_times = []
+    for _ in range(MAX_WARMUP_ITERATIONS if warmup is None else warmup):
+        warmup_times.append(timer.timeit(number=1) * 1000)
+        recent = warmup_times[-WARMUP_WINDOW:]
+        if (
+            warmup is None
+            and len(recent) == WARMUP_WINDOW
+            and max(recent) <= min(recent) * WARMUP_TOLERANCE
+        ):
+            break
+    if warmup_times:
+        print("  warmup: " + " -> ".join(f"{t:.2f}" for t in warmup_times) + " ms")
+
+    # Timed runs, reported per call; re-measure while the samples are noisy
+    number, _ = timer.autorange()
+    for _ in range(MAX_ATTEMPTS):
+        raw = timer.repeat(repeat=iterations, number=number)
+        times = [total / number * 1000 for total in raw]  # Convert to ms
+        mean = statistics.mean(times)
+        stddev = statistics.stdev(times) if len(times) > 1 else 0.0
+        cov = stddev / mean if mean > 0 else 0.0
+        if cov < MAX_COV:
+            break
+    else:
+        print(
+            f"  warning: {cov:.1%} variation after {MAX_ATTEMPTS} attempts; "
+            "disabling turbo boost usually helps (see benchmarks/bench_env.py)"
+        )
 
     return {
-        "mean": sum(times) / len(times),
+        "mean": mean,
+        "median": statistics.median(times),
         "min": min(times),
         "max": max(times),
+        "stddev": stddev,
+        "times": times,
+        "warmup": warmup_times,
+        "unreliable": cov >= MAX_COV,
     }
 
 
-def ensure_test_data():
-    """Ensure test data exists."""
-    if not GTFS_DIR.exists():
-        print("Creating test GTFS data from TXC conversion...")
-        if not TXC_FILE.exists():
-            print(f"ERROR: TXC test file not found: {TXC_FILE}")
-            print("Please provide a TXC file for benchmarking.")
-            sys.exit(1)
+SKIPPED_EXIT_CODE = 3
+
+# Child process for run_in_subprocess. argv: benchmarks dir, setup, statement,
+# warmup (JSON), CPU to pin to (JSON). Progress goes to stdout; the stats are
+# the last line.
+_SUBPROCESS_SCRIPT = """\
+import json, os, sys
+sys.path.insert(0, sys.argv[1])
+cpu = json.loads(sys.argv[5])
+if cpu is not None:
+    os.sched_setaffinity(0, {cpu})
+from run_benchmarks import GTFS_DIR, SKIPPED_EXIT_CODE, TXC_FILE, run_timed
+namespace = {"GTFS_DIR": GTFS_DIR, "TXC_FILE": TXC_FILE}
+try:
+    exec(sys.argv[2], namespace)
+except ImportError:
+    sys.exit(SKIPPED_EXIT_CODE)
+stats = run_timed(sys.argv[3], warmup=json.loads(sys.argv[4]), namespace=namespace)
+print(json.dumps(stats))
+"""
+
+TRANSX2GTFS_SETUP = """\
+import atexit
+import tempfile
+from pathlib import Path
 
-        from transit_parser import TxcDocument, TxcToGtfsConverter, ConversionOptions
+import transx2gtfs
 
-        doc = TxcDocument.from_path(str(TXC_FILE))
-        options = ConversionOptions(include_shapes=False, region="england")
-        converter = TxcToGtfsConverter(options)
-        result = converter.convert(doc)
+tmpdir = tempfile.TemporaryDirectory()
+atexit.register(tmpdir.cleanup)
+output_path = Path(tmpdir.name) / "output.zip"
+
+def transx2gtfs_convert():
+    output_path.unlink(missing_ok=True)
+    transx2gtfs.convert(str(TXC_FILE), str(output_path))
+    return output_path.stat().st_size
+
+if not transx2gtfs_convert():
+    raise RuntimeError("transx2gtfs produced an empty feed")
+"""
+
+
+def _subprocess_cpu() -> Optional[int]:
+    """Core to pin a subprocess to: the lowest core this process may use."""
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    return min(os.sched_getaffinity(0))
+
+
+def run_in_subprocess(setup: str, stmt: str, warmup: Optional[int] = None) -> Optional[dict]:
+    """Time ``stmt`` with run_timed in a fresh interpreter pinned to one CPU.
 
-        GTFS_DIR.mkdir(exist_ok=True)
-        result.feed.to_path(str(GTFS_DIR))
-        print(f"Created test GTFS at {GTFS_DIR}")
+    The child runs on the lowest core this process is pinned to, so parallel
+    workers (each pinned to its own core) do not share a core.
 
+    Keeps heavyweight imports (pandas, geopandas, shapely) out of this
+    process so they cannot skew later benchmarks. Returns None if ``setup``
+    fails, e.g. because the library is not installed.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-c", _SUBPROCESS_SCRIPT, str(Path(__file__).parent),
+         setup, stmt, json.dumps(warmup), json.dumps(_subprocess_cpu())],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode == SKIPPED_EXIT_CODE:
+        return None
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()
+        print(f"  failed: {error[-1] if error else proc.returncode}")
+        return None
+
+    *progress, result = proc.stdout.rstrip().splitlines()
+    for line in progress:
+        print(line)
+    return json.loads(result)
+
+
+def run_isolated(cat: BenchCategory, category: str, benches: list[tuple[str, str, str, str]]):
+    """Add a result per ``(library, name, setup, stmt)`` run in a subprocess."""
+    for library, name, setup, stmt in benches:
+        stats = run_in_subprocess(setup, stmt)
+        if stats is None:
+            continue
+        cat.add(BenchResult.from_stats(name, library, stats, category=category))
+
+
+def _generate_test_data():
+    """Convert the TXC benchmark file into a fresh GTFS feed under GTFS_DIR.
+
+    Only called for a missing or stamped (generated) GTFS_DIR, so any old
+    contents are removed first; files the new feed no longer writes would
+    otherwise linger.
+    """
+    from transit_parser import ConversionOptions, TxcDocument, TxcToGtfsConverter
+
+    doc = TxcDocument.from_path(str(TXC_FILE))
+    options = ConversionOptions(**TEST_DATA_OPTIONS)
+    converter = TxcToGtfsConverter(options)
+    result = converter.convert(doc)
+
+    shutil.rmtree(GTFS_DIR, ignore_errors=True)
+    GTFS_DIR.mkdir(parents=True)
+    result.feed.to_path(str(GTFS_DIR))
+
+
+def _expected_manifest() -> str:
+    """Hash everything the generated GTFS depends on.
+
+    Covers the generator's source, its conversion options, the installed
+    transit-parser (version plus the compiled extension's path and mtime, so
+    a rebuilt converter counts) and the TXC input's identity; changing any
+    of them invalidates the stamp.
+    """
+    import transit_parser
+    from transit_parser import _core
+
+    st = _txc_stat()
+    core = Path(_core.__file__)
+    parts = [
+        inspect.getsource(_generate_test_data),
+        repr(sorted(TEST_DATA_OPTIONS.items())),
+        transit_parser.__version__,
+        f"{core.resolve()}:{core.stat().st_mtime_ns}",
+        str(TXC_FILE.resolve()),
+        f"{st.st_size}:{st.st_mtime_ns}" if st else "missing",
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def ensure_test_data():
+    """Ensure test data exists, regenerating it only when its inputs changed.
+
+    Generated data is stamped with a manifest hash; a GTFS_DIR without a
+    stamp (e.g. one given via BENCH_GTFS_DIR) is used as-is.
+    """
+    stamp = GTFS_DIR / TEST_DATA_MANIFEST
+    if GTFS_DIR.exists() and not stamp.exists():
+        print(f"Test GTFS: using existing data at {GTFS_DIR}")
+        return True
+
+    want = _expected_manifest()
+    if stamp.exists() and stamp.read_text() == want:
+        print(f"Test GTFS: cached at {GTFS_DIR}")
+        return True
+
+    if not _txc_exists():
+        if stamp.exists():
+            print(f"Test GTFS: TXC file not found, reusing stale data at {GTFS_DIR}")
+            return True
+        print(f"ERROR: TXC test file not found: {TXC_FILE}")
+        print("Please provide a TXC file for benchmarking.")
+        sys.exit(1)
+
+    print("Creating test GTFS data from TXC conversion...")
+    _generate_test_data()
+    stamp.write_text(want)
+    print(f"Test GTFS: regenerated at {GTFS_DIR}")
     return True
 
 
+def gtfs_zip_bytes(directory: Path) -> bytes:
+    """Read a GTFS directory into an uncompressed in-memory zip.
+
+    Reading every file also warms the page cache for the path-based
+    loaders. Members are stored rather than deflated so timing
+    ``from_bytes`` measures parsing, not decompression.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+        for path in sorted(directory.glob("*.txt")):
+            zf.writestr(path.name, path.read_bytes())
+    return buffer.getvalue()
+
+
 # ============================================
 # Individual Benchmarks
 # ============================================
@@ -187,59 +617,35 @@ def bench_gtfs_loading() -> BenchCategory:
         description="Time to load a GTFS feed into memory"
     )
 
+    # Start every loader from a warm page cache
+    payload = gtfs_zip_bytes(GTFS_DIR)
+
     # transit-parser GtfsFeed (eager)
     from transit_parser import GtfsFeed
     stats = run_timed(lambda: GtfsFeed.from_path(str(GTFS_DIR)))
-    cat.add(BenchResult(
-        name="eager load",
-        library="transit-parser",
-        category="gtfs_load",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
+    cat.add(BenchResult.from_stats("eager load", "transit-parser", stats, category="gtfs_load"))
+
+    # transit-parser GtfsFeed from memory (parse cost without file I/O)
+    stats = run_timed("GtfsFeed.from_bytes(payload)", namespace={
+        "GtfsFeed": GtfsFeed,
+        "payload": payload,
+    })
+    cat.add(BenchResult.from_stats(
+        "eager load from bytes", "transit-parser", stats, category="gtfs_load",
     ))
 
     # transit-parser LazyGtfsFeed
     from transit_parser import LazyGtfsFeed
-    stats = run_timed(lambda: LazyGtfsFeed.from_path(str(GTFS_DIR)))
-    cat.add(BenchResult(
-        name="lazy load",
-        library="transit-parser",
-        category="gtfs_load",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
-    ))
+    stats = run_timed(lambda: LazyGtfsFeed.from_path(str(GTFS_DIR)), warmup=5)
+    cat.add(BenchResult.from_stats("lazy load", "transit-parser", stats, category="gtfs_load"))
 
-    # partridge
-    try:
-        import partridge
-        stats = run_timed(lambda: partridge.load_geo_feed(str(GTFS_DIR)))
-        cat.add(BenchResult(
-            name="load_geo_feed",
-            library="partridge",
-            category="gtfs_load",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
-
-    # gtfs-kit
-    try:
-        import gtfs_kit
-        stats = run_timed(lambda: gtfs_kit.read_feed(str(GTFS_DIR), dist_units="km"))
-        cat.add(BenchResult(
-            name="read_feed",
-            library="gtfs-kit",
-            category="gtfs_load",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
+    # Third-party libraries, each in a fresh interpreter
+    run_isolated(cat, "gtfs_load", [
+        ("partridge", "load_geo_feed", "import partridge",
+         "partridge.load_geo_feed(str(GTFS_DIR))"),
+        ("gtfs-kit", "read_feed", "import gtfs_kit",
+         "gtfs_kit.read_feed(str(GTFS_DIR), dist_units='km')"),
+    ])
 
     return cat
 
@@ -254,14 +660,9 @@ def bench_gtfs_stop_times_access() -> BenchCategory:
     # transit-parser GtfsFeed (already loaded)
     from transit_parser import GtfsFeed
     feed = GtfsFeed.from_path(str(GTFS_DIR))
-    stats = run_timed(lambda: feed.stop_times)
-    cat.add(BenchResult(
-        name="cached access",
-        library="transit-parser (eager)",
-        category="stop_times_access",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
+    stats = run_timed("feed.stop_times", namespace={"feed": feed})
+    cat.add(BenchResult.from_stats(
+        "cached access", "transit-parser (eager)", stats, category="stop_times_access",
     ))
 
     # transit-parser LazyGtfsFeed (first access)
@@ -270,50 +671,17 @@ def bench_gtfs_stop_times_access() -> BenchCategory:
         feed = LazyGtfsFeed.from_path(str(GTFS_DIR))
         return feed.stop_times
     stats = run_timed(lazy_first_access)
-    cat.add(BenchResult(
-        name="first access",
-        library="transit-parser (lazy)",
-        category="stop_times_access",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
+    cat.add(BenchResult.from_stats(
+        "first access", "transit-parser (lazy)", stats, category="stop_times_access",
     ))
 
-    # partridge
-    try:
-        import partridge
-        def partridge_access():
-            feed = partridge.load_geo_feed(str(GTFS_DIR))
-            return feed.stop_times
-        stats = run_timed(partridge_access)
-        cat.add(BenchResult(
-            name="first access",
-            library="partridge",
-            category="stop_times_access",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
-
-    # gtfs-kit
-    try:
-        import gtfs_kit
-        def gtfs_kit_access():
-            feed = gtfs_kit.read_feed(str(GTFS_DIR), dist_units="km")
-            return feed.stop_times
-        stats = run_timed(gtfs_kit_access)
-        cat.add(BenchResult(
-            name="access",
-            library="gtfs-kit",
-            category="stop_times_access",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
+    # Third-party libraries, each in a fresh interpreter
+    run_isolated(cat, "stop_times_access", [
+        ("partridge", "first access", "import partridge",
+         "partridge.load_geo_feed(str(GTFS_DIR)).stop_times"),
+        ("gtfs-kit", "access", "import gtfs_kit",
+         "gtfs_kit.read_feed(str(GTFS_DIR), dist_units='km').stop_times"),
+    ])
 
     return cat
 
@@ -325,64 +693,21 @@ def bench_gtfs_dataframe() -> BenchCategory:
         description="Time to get stop_times as a pandas DataFrame"
     )
 
-    try:
-        import pandas
-    except ImportError:
-        return cat
-
-    # transit-parser GtfsDataFrames
-    try:
-        from transit_parser.dataframes import GtfsDataFrames
-        def df_access():
-            dfs = GtfsDataFrames.from_path(str(GTFS_DIR))
-            return dfs.stop_times
-        stats = run_timed(df_access)
-        cat.add(BenchResult(
-            name="stop_times DataFrame",
-            library="transit-parser",
-            category="dataframe",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
-
-    # partridge (returns DataFrames natively)
-    try:
-        import partridge
-        def partridge_df():
-            feed = partridge.load_geo_feed(str(GTFS_DIR))
-            return feed.stop_times  # Already a DataFrame
-        stats = run_timed(partridge_df)
-        cat.add(BenchResult(
-            name="stop_times DataFrame",
-            library="partridge",
-            category="dataframe",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
-
-    # gtfs-kit (returns DataFrames natively)
-    try:
-        import gtfs_kit
-        def gtfs_kit_df():
-            feed = gtfs_kit.read_feed(str(GTFS_DIR), dist_units="km")
-            return feed.stop_times
-        stats = run_timed(gtfs_kit_df)
-        cat.add(BenchResult(
-            name="stop_times DataFrame",
-            library="gtfs-kit",
-            category="dataframe",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
+    # pandas is only imported in subprocesses, so every library (including
+    # transit-parser's GtfsDataFrames) is measured in its own interpreter
+    run_isolated(cat, "dataframe", [
+        ("transit-parser", "stop_times DataFrame",
+         "import pandas\nfrom transit_parser.dataframes import GtfsDataFrames",
+         "GtfsDataFrames.from_path(str(GTFS_DIR)).stop_times"),
+    ])
+
+    # Third-party libraries return DataFrames natively
+    run_isolated(cat, "dataframe", [
+        ("partridge", "stop_times DataFrame", "import partridge",
+         "partridge.load_geo_feed(str(GTFS_DIR)).stop_times"),
+        ("gtfs-kit", "stop_times DataFrame", "import gtfs_kit",
+         "gtfs_kit.read_feed(str(GTFS_DIR), dist_units='km').stop_times"),
+    ])
 
     return cat
 
@@ -394,67 +719,22 @@ def bench_txc_parsing() -> BenchCategory:
         description="Time to parse a TransXChange XML file"
     )
 
-    if not TXC_FILE.exists():
+    if not _txc_exists():
         return cat
 
     # transit-parser
     from transit_parser import TxcDocument
-    stats = run_timed(lambda: TxcDocument.from_path(str(TXC_FILE)))
-    cat.add(BenchResult(
-        name="parse XML",
-        library="transit-parser",
-        category="txc_parse",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
-    ))
-
-    # lxml baseline
-    try:
-        from lxml import etree
-        stats = run_timed(lambda: etree.parse(str(TXC_FILE)))
-        cat.add(BenchResult(
-            name="parse XML (baseline)",
-            library="lxml",
-            category="txc_parse",
-            mean_ms=stats["mean"],
-            min_ms=stats["min"],
-            max_ms=stats["max"],
-        ))
-    except ImportError:
-        pass
-
-    # transx2gtfs (if available) - skip if it fails on the file
-    try:
-        import transx2gtfs
-        import tempfile
-
-        # Test if it actually works on this file
-        works = False
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.zip"
-            try:
-                transx2gtfs.convert(str(TXC_FILE), str(output_path))
-                works = output_path.exists() and output_path.stat().st_size > 0
-            except Exception:
-                pass
-
-        if works:
-            def transx2gtfs_convert():
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    output_path = Path(tmpdir) / "output.zip"
-                    transx2gtfs.convert(str(TXC_FILE), str(output_path))
-            stats = run_timed(transx2gtfs_convert)
-            cat.add(BenchResult(
-                name="full conversion",
-                library="transx2gtfs",
-                category="txc_parse",
-                mean_ms=stats["mean"],
-                min_ms=stats["min"],
-                max_ms=stats["max"],
-            ))
-    except ImportError:
-        pass
+    stats = run_timed(lambda: TxcDocument.from_path(str(TXC_FILE)), warmup=5)
+    cat.add(BenchResult.from_stats("parse XML", "transit-parser", stats, category="txc_parse"))
+
+    # lxml baseline and transx2gtfs, each in a fresh interpreter. transx2gtfs
+    # is skipped if its trial conversion fails on the file.
+    run_isolated(cat, "txc_parse", [
+        ("lxml", "parse XML (baseline)", "from lxml import etree",
+         "etree.parse(str(TXC_FILE))"),
+        ("transx2gtfs", "full conversion", TRANSX2GTFS_SETUP,
+         "transx2gtfs_convert()"),
+    ])
 
     return cat
 
@@ -466,59 +746,72 @@ def bench_txc_to_gtfs() -> BenchCategory:
         description="Time to convert TransXChange to GTFS format"
     )
 
-    if not TXC_FILE.exists():
+    if not _txc_exists():
         return cat
 
     # transit-parser
-    from transit_parser import TxcDocument, TxcToGtfsConverter, ConversionOptions
+    from transit_parser import ConversionOptions, TxcDocument, TxcToGtfsConverter
     doc = TxcDocument.from_path(str(TXC_FILE))
-    options = ConversionOptions(include_shapes=False, region="england")
+    options = ConversionOptions(**TEST_DATA_OPTIONS)
     converter = TxcToGtfsConverter(options)
 
     # Parse only
     stats = run_timed(lambda: TxcDocument.from_path(str(TXC_FILE)))
-    cat.add(BenchResult(
-        name="parse only",
-        library="transit-parser",
-        category="txc_convert",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
-    ))
+    cat.add(BenchResult.from_stats("parse only", "transit-parser", stats, category="txc_convert"))
 
     # Convert only (doc already parsed)
     stats = run_timed(lambda: converter.convert(doc))
-    cat.add(BenchResult(
-        name="convert only",
-        library="transit-parser",
-        category="txc_convert",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
-    ))
+    cat.add(BenchResult.from_stats("convert only", "transit-parser", stats, category="txc_convert"))
 
     # Full pipeline
     def full_pipeline():
         doc = TxcDocument.from_path(str(TXC_FILE))
         return converter.convert(doc)
     stats = run_timed(full_pipeline)
-    cat.add(BenchResult(
-        name="full pipeline",
-        library="transit-parser",
-        category="txc_convert",
-        mean_ms=stats["mean"],
-        min_ms=stats["min"],
-        max_ms=stats["max"],
+    cat.add(BenchResult.from_stats(
+        "full pipeline", "transit-parser", stats, category="txc_convert",
     ))
 
     return cat
 
 
+def load_pytest_benchmark_json(path: Path) -> list[BenchCategory]:
+    """Load a ``pytest --benchmark-json`` export as benchmark categories.
+
+    Results are grouped by benchmark group (set with
+    ``@pytest.mark.benchmark(group=...)``), falling back to the module
+    name. The library comes from ``extra_info["library"]``, which the
+    comparison benchmarks set; untagged benchmarks are transit-parser's own.
+    """
+    data = json.loads(Path(path).read_text())
+    categories: dict[str, BenchCategory] = {}
+
+    for bench in data.get("benchmarks", []):
+        module = bench["fullname"].split("::")[0]
+        group = bench.get("group") or Path(module).stem
+        cat = categories.setdefault(group, BenchCategory(name=group, description=module))
+        extra = bench.get("extra_info") or {}
+
+        # pytest-benchmark reports seconds; run_timed reports milliseconds
+        raw = bench["stats"]
+        stats = {key: raw[key] * 1000 for key in ("mean", "median", "min", "max", "stddev")}
+        stats["times"] = [t * 1000 for t in raw.get("data", ())]
+        stats["unreliable"] = extra.get("unreliable", False)
+        cat.add(BenchResult.from_stats(
+            bench["name"], extra.get("library", "transit-parser"), stats,
+            category=extra.get("category", group),
+        ))
+
+    return list(categories.values())
+
+
 # ============================================
 # Report Generation
 # ============================================
 
-def generate_report(categories: list[BenchCategory]) -> str:
+def generate_report(
+    categories: list[BenchCategory], baseline: Optional[Baseline] = None
+) -> str:
     """Generate the BENCH.md report."""
     lines = [
         "# Benchmark Results",
@@ -548,8 +841,8 @@ def generate_report(categories: list[BenchCategory]) -> str:
             "",
         ])
 
-    if TXC_FILE.exists():
-        size_mb = TXC_FILE.stat().st_size / 1024 / 1024
+    if _txc_exists():
+        size_mb = _txc_size() / 1024 / 1024
         lines.extend([
             f"- TXC File: `{TXC_FILE.name}` ({size_mb:.1f} MB)",
             "",
@@ -568,10 +861,11 @@ def generate_report(categories: list[BenchCategory]) -> str:
         lines.append(f"_{cat.description}_")
         lines.append("")
         lines.append("```")
-        lines.append(format_bar_chart(cat.sorted_by_mean()))
+        ranked = cat.sorted_by_median()
+        lines.append(format_bar_chart(ranked))
         lines.append("```")
         lines.append("")
-        lines.append(format_comparison_table(cat.results))
+        lines.append(format_comparison_table(ranked, baseline))
         lines.append("")
 
     # Summary
@@ -585,7 +879,7 @@ def generate_report(categories: list[BenchCategory]) -> str:
         if not cat.results:
             continue
 
-        sorted_results = cat.sorted_by_mean()
+        sorted_results = cat.sorted_by_median()
 
         # Find comparable transit-parser result (prefer "first access" over "cached" for fair comparison)
         tp_results = [r for r in sorted_results if "transit-parser" in r.library]
@@ -593,23 +887,20 @@ def generate_report(categories: list[BenchCategory]) -> str:
 
         if tp_results and other_results:
             # For fair comparison, prefer first access over cached access
+            # (the lists are already sorted, so the first entry is the best)
             tp_comparable = [r for r in tp_results if "cached" not in r.name.lower()]
-            if tp_comparable:
-                best_tp = min(tp_comparable, key=lambda r: r.mean_ms)
-            else:
-                best_tp = min(tp_results, key=lambda r: r.mean_ms)
+            best_tp = (tp_comparable or tp_results)[0]
+            best_other = other_results[0]
 
-            best_other = min(other_results, key=lambda r: r.mean_ms)
-
-            if best_tp.mean_ms < best_other.mean_ms:
-                speedup = best_other.mean_ms / best_tp.mean_ms
+            if best_tp.median_ms < best_other.median_ms:
+                speedup = best_other.median_ms / best_tp.median_ms
                 if speedup > 1.1:
                     lines.append(
                         f"- **{cat.name}**: `transit-parser` is "
                         f"**{speedup:.1f}x faster** than `{best_other.library}`"
                     )
             else:
-                slowdown = best_tp.mean_ms / best_other.mean_ms
+                slowdown = best_tp.median_ms / best_other.median_ms
                 if slowdown > 1.1:
                     lines.append(
                         f"- **{cat.name}**: `{best_other.library}` is "
@@ -623,6 +914,12 @@ def generate_report(categories: list[BenchCategory]) -> str:
     lines.append("- **Typed objects** are 3x faster to access than pandas DataFrames")
     lines.append("- **Caching** makes repeated access essentially free")
     lines.append("")
+    if any(r.unreliable for cat in categories for r in cat.results):
+        lines.append(
+            f"⚠️ Variation stayed above {MAX_COV:.0%} after {MAX_ATTEMPTS} attempts; "
+            "treat these results with caution."
+        )
+        lines.append("")
     lines.append("---")
     lines.append("")
     lines.append("*Benchmarks run with `python benchmarks/run_benchmarks.py`*")
@@ -634,45 +931,110 @@ def generate_report(categories: list[BenchCategory]) -> str:
 # Main
 # ============================================
 
-def main():
-    """Run all benchmarks and generate report."""
-    print("=" * 60)
-    print("  transit-parser Benchmark Suite")
-    print("=" * 60)
-    print()
+# Benchmark categories in report order, with their progress labels
+BENCHMARKS = [
+    ("GTFS loading", bench_gtfs_loading),
+    ("stop_times access", bench_gtfs_stop_times_access),
+    ("DataFrame", bench_gtfs_dataframe),
+    ("TXC parsing", bench_txc_parsing),
+    ("TXC to GTFS conversion", bench_txc_to_gtfs),
+]
+
+
+def _pin_worker(cpus: "multiprocessing.Queue[int]"):
+    """Pin a pool worker to the next unused core from ``cpus``."""
+    os.sched_setaffinity(0, {cpus.get()})
 
+
+def run_all_benchmarks(jobs: int = 1) -> list[BenchCategory]:
+    """Run every benchmark category, optionally across ``jobs`` processes.
+
+    Each worker is pinned to its own core (the highest ``jobs`` cores
+    available), and so are the subprocesses it starts. Categories running
+    side by side still compete for memory bandwidth, so parallel runs are
+    for quick checks, not for published numbers.
+    """
     # Ensure test data
     print("Checking test data...")
     ensure_test_data()
     print()
 
-    # Run benchmarks
-    categories = []
+    if jobs > 1:
+        initializer, initargs = None, ()
+        if hasattr(os, "sched_setaffinity"):
+            cpus = sorted(os.sched_getaffinity(0))
+            if jobs > len(cpus):
+                print(f"  note: only {len(cpus)} CPUs available, using {len(cpus)} processes")
+                jobs = len(cpus)
+            queue = multiprocessing.Queue()
+            for cpu in cpus[-jobs:]:
+                queue.put(cpu)
+            initializer, initargs = _pin_worker, (queue,)
+
+        print(f"Running {len(BENCHMARKS)} benchmark categories across {jobs} processes...")
+        with ProcessPoolExecutor(max_workers=jobs, initializer=initializer,
+                                 initargs=initargs) as pool:
+            futures = [pool.submit(bench) for _, bench in BENCHMARKS]
+            return [future.result() for future in futures]
 
-    print("Running GTFS loading benchmarks...")
-    categories.append(bench_gtfs_loading())
+    categories = []
+    for label, bench in BENCHMARKS:
+        print(f"Running {label} benchmarks...")
+        categories.append(bench())
+    return categories
 
-    print("Running stop_times access benchmarks...")
-    categories.append(bench_gtfs_stop_times_access())
 
-    print("Running DataFrame benchmarks...")
-    categories.append(bench_gtfs_dataframe())
+def main():
+    """Run all benchmarks and generate report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--from-json",
+        type=Path,
+        metavar="PATH",
+        help="build the report from a pytest-benchmark JSON export instead of running",
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="SHA",
+        help="compare against the latest saved run for this commit (see benchmarks/results/)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="run benchmark categories in N parallel processes (faster, but noisier timings)",
+    )
+    args = parser.parse_args()
+    baseline = load_baseline(args.baseline) if args.baseline else None
 
-    print("Running TXC parsing benchmarks...")
-    categories.append(bench_txc_parsing())
+    print("=" * 60)
+    print("  transit-parser Benchmark Suite")
+    print("=" * 60)
+    print()
 
-    print("Running TXC to GTFS conversion benchmarks...")
-    categories.append(bench_txc_to_gtfs())
+    if args.from_json:
+        print(f"Loading pytest-benchmark results from {args.from_json}...")
+        categories = load_pytest_benchmark_json(args.from_json)
+    else:
+        # Parallel runs pin each worker to its own core instead
+        stabilize(pin=args.jobs == 1)
+        print()
+        categories = run_all_benchmarks(args.jobs)
+        print()
+        print(f"Raw timings saved to: {save_results(categories)}")
 
     print()
 
     # Generate report
     print("Generating report...")
-    report = generate_report(categories)
+    report = generate_report(categories, baseline)
 
     # Write to file
     BENCH_MD.write_text(report)
     print(f"Report written to: {BENCH_MD}")
+    write_json_report(categories)
+    print(f"JSON results written to: {RESULTS_JSON}")
     print()
 
     # Print summary to console
@@ -687,7 +1049,7 @@ def main():
 
         print(f"### {cat.name}")
         print()
-        print(format_bar_chart(cat.sorted_by_mean()))
+        print(format_bar_chart(cat.sorted_by_median()))
         print()
 
 
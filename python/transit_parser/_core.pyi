@@ -301,6 +301,8 @@ class CsvDocument:
     def columns(self) -> list[str]: ...
     @property
     def rows(self) -> list[dict]: ...
+    def column(self, name: str) -> list[object]: ...
+    def __getitem__(self, index: int) -> dict[str, object]: ...
 
 # JSON
 
@@ -327,6 +329,9 @@ class JsonDocument:
     def root(self) -> object: ...
 
     def pointer(self, path: str) -> object | None: ...
+    def keys(self) -> list[str]: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, key: str | int) -> object: ...
 
 # Adapters
 
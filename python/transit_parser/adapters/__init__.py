@@ -1,11 +1,20 @@
-"""Format conversion adapters."""
+"""Format conversion adapters.
 
-from transit_parser._core import (
-    ConversionOptions,
-    ConversionResult,
-    ConversionStats,
-    TxcToGtfsConverter,
-)
+The adapter classes are resolved from the Rust bindings on first attribute
+access (PEP 562) rather than at import time.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from transit_parser._core import (
+        ConversionOptions,
+        ConversionResult,
+        ConversionStats,
+        TxcToGtfsConverter,
+    )
 
 __all__ = [
     "TxcToGtfsConverter",
@@ -13,3 +22,17 @@ __all__ = [
     "ConversionResult",
     "ConversionStats",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from transit_parser import _core
+
+        obj = getattr(_core, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -16,6 +16,10 @@ Or using the convenience methods:
 
     dfs = GtfsDataFrames.from_path("gtfs/")
     print(dfs.stop_times.head())
+
+Pass ``categorical=True`` to store the repeated ID columns
+(trips.route_id/service_id, stop_times.trip_id/stop_id) as pandas
+categoricals instead of object strings, which cuts memory on large feeds.
 """
 
 from __future__ import annotations
@@ -38,6 +42,16 @@ def _check_pandas() -> Any:
         )
 
 
+def _as_categorical(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Store repeated ID columns as pandas categoricals.
+
+    IDs such as trip_id/stop_id repeat across many rows; categorical
+    storage keeps one copy of each distinct string plus integer codes.
+    """
+    present = [c for c in columns if c in df.columns]
+    return df.astype(dict.fromkeys(present, "category"))
+
+
 class GtfsDataFrames:
     """Lazy-loading GTFS DataFrames.
 
@@ -45,13 +59,19 @@ class GtfsDataFrames:
     Each DataFrame is computed on first access and cached.
     """
 
-    def __init__(self, feed: Any):
+    def __init__(self, feed: Any, categorical: bool = False):
         """Create DataFrames wrapper from a GtfsFeed or LazyGtfsFeed.
 
         Args:
             feed: A GtfsFeed or LazyGtfsFeed instance
+            categorical: Store repeated ID columns (trips.route_id and
+                service_id, stop_times.trip_id and stop_id) with the pandas
+                ``category`` dtype rather than ``object``. Saves memory on
+                large feeds, but categoricals behave differently in string
+                operations and merges with object columns.
         """
         self._feed = feed
+        self._categorical = categorical
         self._agencies_df: pd.DataFrame | None = None
         self._stops_df: pd.DataFrame | None = None
         self._routes_df: pd.DataFrame | None = None
@@ -62,32 +82,34 @@ class GtfsDataFrames:
         self._shapes_df: pd.DataFrame | None = None
 
     @classmethod
-    def from_path(cls, path: str) -> GtfsDataFrames:
+    def from_path(cls, path: str, categorical: bool = False) -> GtfsDataFrames:
         """Load GTFS feed from a directory path as DataFrames.
 
         Args:
             path: Path to GTFS directory
+            categorical: Store repeated ID columns as categoricals
 
         Returns:
             GtfsDataFrames instance with lazy-loaded DataFrames
         """
         from transit_parser import LazyGtfsFeed
         feed = LazyGtfsFeed.from_path(path)
-        return cls(feed)
+        return cls(feed, categorical=categorical)
 
     @classmethod
-    def from_zip(cls, path: str) -> GtfsDataFrames:
+    def from_zip(cls, path: str, categorical: bool = False) -> GtfsDataFrames:
         """Load GTFS feed from a ZIP file as DataFrames.
 
         Args:
             path: Path to GTFS ZIP file
+            categorical: Store repeated ID columns as categoricals
 
         Returns:
             GtfsDataFrames instance with lazy-loaded DataFrames
         """
         from transit_parser import LazyGtfsFeed
         feed = LazyGtfsFeed.from_zip(path)
-        return cls(feed)
+        return cls(feed, categorical=categorical)
 
     @property
     def agencies(self) -> pd.DataFrame:
@@ -147,7 +169,7 @@ class GtfsDataFrames:
         if self._trips_df is None:
             pd = _check_pandas()
             trips = self._feed.trips
-            self._trips_df = pd.DataFrame([
+            df = pd.DataFrame([
                 {
                     "trip_id": t.id,
                     "route_id": t.route_id,
@@ -156,6 +178,9 @@ class GtfsDataFrames:
                 }
                 for t in trips
             ])
+            if self._categorical:
+                df = _as_categorical(df, ["route_id", "service_id"])
+            self._trips_df = df
         return self._trips_df
 
     @property
@@ -164,7 +189,7 @@ class GtfsDataFrames:
         if self._stop_times_df is None:
             pd = _check_pandas()
             stop_times = self._feed.stop_times
-            self._stop_times_df = pd.DataFrame([
+            df = pd.DataFrame([
                 {
                     "trip_id": st.trip_id,
                     "arrival_time": st.arrival_time,
@@ -174,6 +199,9 @@ class GtfsDataFrames:
                 }
                 for st in stop_times
             ])
+            if self._categorical:
+                df = _as_categorical(df, ["trip_id", "stop_id"])
+            self._stop_times_df = df
         return self._stop_times_df
 
     @property
@@ -234,11 +262,12 @@ class GtfsDataFrames:
         return self._shapes_df
 
 
-def to_dataframes(feed: Any) -> GtfsDataFrames:
+def to_dataframes(feed: Any, categorical: bool = False) -> GtfsDataFrames:
     """Convert a GTFS feed to DataFrames.
 
     Args:
         feed: A GtfsFeed or LazyGtfsFeed instance
+        categorical: Store repeated ID columns as categoricals
 
     Returns:
         GtfsDataFrames instance with lazy-loaded DataFrames
@@ -250,4 +279,4 @@ def to_dataframes(feed: Any) -> GtfsDataFrames:
         >>> dfs = to_dataframes(feed)
         >>> print(dfs.stop_times.head())
     """
-    return GtfsDataFrames(feed)
+    return GtfsDataFrames(feed, categorical=categorical)
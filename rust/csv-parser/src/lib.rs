@@ -8,7 +8,7 @@ pub use reader::{CsvReader, ReadOptions};
 pub use schema::{ColumnType, CsvSchema};
 pub use writer::{CsvWriter, WriteOptions};
 
-use serde_json::Value;
+use serde_json::{Map, Value};
 use std::path::Path;
 use transit_core::ParseError;
 
@@ -17,8 +17,8 @@ use transit_core::ParseError;
 pub struct CsvDocument {
     /// Inferred or provided schema.
     pub schema: CsvSchema,
-    /// Rows as JSON objects.
-    pub rows: Vec<Value>,
+    /// Column-major cell values, one vector per schema column.
+    pub columns: Vec<Vec<Value>>,
 }
 
 impl CsvDocument {
@@ -46,7 +46,7 @@ impl CsvDocument {
     /// Write CSV to path.
     pub fn to_path(&self, path: impl AsRef<Path>) -> Result<(), ParseError> {
         CsvWriter::write_path(
-            &self.rows,
+            &self.columns,
             &self.schema,
             path.as_ref(),
             WriteOptions::default(),
@@ -55,16 +55,40 @@ impl CsvDocument {
 
     /// Write CSV to string.
     pub fn to_string(&self) -> Result<String, ParseError> {
-        CsvWriter::write_string(&self.rows, &self.schema, WriteOptions::default())
+        CsvWriter::write_string(&self.columns, &self.schema, WriteOptions::default())
     }
 
     /// Get the number of rows.
     pub fn len(&self) -> usize {
-        self.rows.len()
+        self.columns.first().map_or(0, Vec::len)
     }
 
     /// Check if document is empty.
     pub fn is_empty(&self) -> bool {
-        self.rows.is_empty()
+        self.len() == 0
+    }
+
+    /// Get all values of a column by name.
+    pub fn column(&self, name: &str) -> Option<&[Value]> {
+        self.schema
+            .columns
+            .iter()
+            .position(|c| c.name == name)
+            .map(|i| self.columns[i].as_slice())
+    }
+
+    /// Assemble a single row as a JSON object.
+    pub fn row(&self, index: usize) -> Option<Value> {
+        if index >= self.len() {
+            return None;
+        }
+        let map: Map<String, Value> = self
+            .schema
+            .columns
+            .iter()
+            .zip(&self.columns)
+            .map(|(col, values)| (col.name.clone(), values[index].clone()))
+            .collect();
+        Some(Value::Object(map))
     }
 }
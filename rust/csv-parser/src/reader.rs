@@ -3,12 +3,18 @@
 use crate::schema::{ColumnDefinition, ColumnType, CsvSchema};
 use crate::CsvDocument;
 use csv::ReaderBuilder;
-use serde_json::{Map, Value};
+use serde_json::Value;
 use std::fs::File;
 use std::io::Read;
 use std::path::Path;
 use transit_core::ParseError;
 
+/// Read buffer size used when parsing files.
+const FILE_BUFFER_CAPACITY: usize = 1 << 20;
+
+/// The csv crate's default read buffer size.
+const DEFAULT_BUFFER_CAPACITY: usize = 8 * 1024;
+
 /// Options for reading CSV files.
 #[derive(Debug, Clone)]
 pub struct ReadOptions {
@@ -41,14 +47,18 @@ pub struct CsvReader;
 
 impl CsvReader {
     /// Read a CSV file from path.
+    ///
+    /// The file is parsed while it is read through a large buffer, so few
+    /// read calls are made, kernel readahead overlaps with parsing, and the
+    /// whole file is never held in memory next to the parsed document.
     pub fn read_path(path: &Path, options: ReadOptions) -> Result<CsvDocument, ParseError> {
         let file = File::open(path)?;
-        Self::read_impl(file, options)
+        Self::read_impl(file, options, FILE_BUFFER_CAPACITY)
     }
 
     /// Read CSV from bytes.
     pub fn read_bytes(bytes: &[u8], options: ReadOptions) -> Result<CsvDocument, ParseError> {
-        Self::read_impl(bytes, options)
+        Self::read_impl(bytes, options, DEFAULT_BUFFER_CAPACITY)
     }
 
     /// Read CSV from string.
@@ -56,8 +66,13 @@ impl CsvReader {
         Self::read_bytes(csv.as_bytes(), options)
     }
 
-    fn read_impl<R: Read>(reader: R, options: ReadOptions) -> Result<CsvDocument, ParseError> {
+    fn read_impl<R: Read>(
+        reader: R,
+        options: ReadOptions,
+        buffer_capacity: usize,
+    ) -> Result<CsvDocument, ParseError> {
         let mut csv_reader = ReaderBuilder::new()
+            .buffer_capacity(buffer_capacity)
             .delimiter(options.delimiter)
             .has_headers(options.has_header)
             .flexible(options.lenient)
@@ -76,21 +91,24 @@ impl CsvReader {
             Vec::new()
         };
 
-        // Read all records
-        let mut records: Vec<csv::StringRecord> = Vec::new();
-        for result in csv_reader.records() {
-            match result {
-                Ok(record) => records.push(record),
-                Err(e) if options.lenient => {
-                    eprintln!("Warning: skipping malformed record: {}", e);
-                }
-                Err(e) => return Err(ParseError::Csv(e.to_string())),
-            }
+        // Only the type-inference sample is buffered; every later record is
+        // converted as soon as it is read.
+        let sample_size = if options.infer_types {
+            options.sample_size
+        } else {
+            0
+        };
+        let mut record = csv::StringRecord::new();
+        let mut sample: Vec<csv::StringRecord> = Vec::with_capacity(sample_size);
+        while sample.len() < sample_size
+            && Self::read_next(&mut csv_reader, &mut record, options.lenient)?
+        {
+            sample.push(record.clone());
         }
 
         // Infer schema
         let schema = if options.infer_types {
-            Self::infer_schema(&headers, &records, options.sample_size)
+            Self::infer_schema(&headers, &sample)
         } else {
             CsvSchema::with_columns(
                 headers
@@ -104,22 +122,42 @@ impl CsvReader {
             )
         };
 
-        // Convert records to JSON
-        let rows: Vec<Value> = records
+        // Convert records into column-major storage
+        let converters: Vec<CellConverter> = schema
+            .columns
             .iter()
-            .map(|record| Self::record_to_json(record, &schema))
+            .map(|col| converter_for(col.col_type))
             .collect();
+        let mut columns: Vec<Vec<Value>> = vec![Vec::new(); schema.columns.len()];
+        for sampled in &sample {
+            Self::push_record(sampled, &converters, &mut columns);
+        }
+        // Reuse one record buffer for the rest of the file
+        while Self::read_next(&mut csv_reader, &mut record, options.lenient)? {
+            Self::push_record(&record, &converters, &mut columns);
+        }
 
-        Ok(CsvDocument { schema, rows })
+        Ok(CsvDocument { schema, columns })
     }
 
-    fn infer_schema(
-        headers: &[String],
-        records: &[csv::StringRecord],
-        sample_size: usize,
-    ) -> CsvSchema {
-        let sample = &records[..records.len().min(sample_size)];
+    /// Read the next record into `record`, returning false at end of input.
+    fn read_next<R: Read>(
+        csv_reader: &mut csv::Reader<R>,
+        record: &mut csv::StringRecord,
+        lenient: bool,
+    ) -> Result<bool, ParseError> {
+        loop {
+            match csv_reader.read_record(record) {
+                Ok(has_record) => return Ok(has_record),
+                Err(e) if lenient => {
+                    eprintln!("Warning: skipping malformed record: {}", e);
+                }
+                Err(e) => return Err(ParseError::Csv(e.to_string())),
+            }
+        }
+    }
 
+    fn infer_schema(headers: &[String], sample: &[csv::StringRecord]) -> CsvSchema {
         let columns: Vec<ColumnDefinition> = headers
             .iter()
             .enumerate()
@@ -156,36 +194,60 @@ impl CsvReader {
         CsvSchema::with_columns(columns)
     }
 
-    fn record_to_json(record: &csv::StringRecord, schema: &CsvSchema) -> Value {
-        let mut map = Map::new();
-
-        for (i, col) in schema.columns.iter().enumerate() {
+    fn push_record(
+        record: &csv::StringRecord,
+        converters: &[CellConverter],
+        columns: &mut [Vec<Value>],
+    ) {
+        for (i, (convert, values)) in converters.iter().zip(columns.iter_mut()).enumerate() {
             let value = record.get(i).unwrap_or("");
 
             let json_value = if value.is_empty() {
                 Value::Null
             } else {
-                match col.col_type {
-                    ColumnType::String => Value::String(value.to_string()),
-                    ColumnType::Integer => value
-                        .parse::<i64>()
-                        .map(Value::from)
-                        .unwrap_or_else(|_| Value::String(value.to_string())),
-                    ColumnType::Float => value
-                        .parse::<f64>()
-                        .map(Value::from)
-                        .unwrap_or_else(|_| Value::String(value.to_string())),
-                    ColumnType::Boolean => value
-                        .parse::<bool>()
-                        .map(Value::from)
-                        .unwrap_or_else(|_| Value::String(value.to_string())),
-                    ColumnType::Date | ColumnType::DateTime => Value::String(value.to_string()),
-                }
+                convert(value)
             };
 
-            map.insert(col.name.clone(), json_value);
+            values.push(json_value);
         }
+    }
+}
 
-        Value::Object(map)
+/// Converts a non-empty CSV field into a typed JSON value.
+type CellConverter = fn(&str) -> Value;
+
+/// Pick the converter for a column type once, so the row loop does not
+/// re-dispatch on the schema for every cell.
+fn converter_for(col_type: ColumnType) -> CellConverter {
+    match col_type {
+        ColumnType::String | ColumnType::Date | ColumnType::DateTime => convert_string,
+        ColumnType::Integer => convert_integer,
+        ColumnType::Float => convert_float,
+        ColumnType::Boolean => convert_boolean,
     }
 }
+
+fn convert_string(value: &str) -> Value {
+    Value::String(value.to_string())
+}
+
+fn convert_integer(value: &str) -> Value {
+    value
+        .parse::<i64>()
+        .map(Value::from)
+        .unwrap_or_else(|_| convert_string(value))
+}
+
+fn convert_float(value: &str) -> Value {
+    value
+        .parse::<f64>()
+        .map(Value::from)
+        .unwrap_or_else(|_| convert_string(value))
+}
+
+fn convert_boolean(value: &str) -> Value {
+    value
+        .parse::<bool>()
+        .map(Value::from)
+        .unwrap_or_else(|_| convert_string(value))
+}
@@ -31,28 +31,28 @@ pub struct CsvWriter;
 impl CsvWriter {
     /// Write CSV to path.
     pub fn write_path(
-        rows: &[Value],
+        columns: &[Vec<Value>],
         schema: &CsvSchema,
         path: &Path,
         options: WriteOptions,
     ) -> Result<(), ParseError> {
         let file = File::create(path)?;
-        Self::write_impl(rows, schema, file, options)
+        Self::write_impl(columns, schema, file, options)
     }
 
     /// Write CSV to string.
     pub fn write_string(
-        rows: &[Value],
+        columns: &[Vec<Value>],
         schema: &CsvSchema,
         options: WriteOptions,
     ) -> Result<String, ParseError> {
         let mut buffer = Vec::new();
-        Self::write_impl(rows, schema, &mut buffer, options)?;
+        Self::write_impl(columns, schema, &mut buffer, options)?;
         String::from_utf8(buffer).map_err(|e| ParseError::Csv(e.to_string()))
     }
 
     fn write_impl<W: std::io::Write>(
-        rows: &[Value],
+        columns: &[Vec<Value>],
         schema: &CsvSchema,
         writer: W,
         options: WriteOptions,
@@ -70,11 +70,11 @@ impl CsvWriter {
         }
 
         // Write rows
-        for row in rows {
-            let record: Vec<String> = schema
-                .columns
+        let row_count = columns.first().map_or(0, Vec::len);
+        for index in 0..row_count {
+            let record: Vec<String> = columns
                 .iter()
-                .map(|col| Self::value_to_string(row.get(&col.name)))
+                .map(|values| Self::value_to_string(values.get(index)))
                 .collect();
             csv_writer
                 .write_record(&record)
@@ -3,13 +3,13 @@
 //! This module provides a lazy-loading version of GtfsFeed that defers
 //! CSV parsing until first access, similar to partridge's approach.
 
-use crate::reader::ReadOptions;
+use crate::reader::{ReadOptions, REQUIRED_FILES};
 use crate::types::*;
 use chrono::NaiveDate;
 use csv::ReaderBuilder;
-use std::collections::HashMap;
-use std::fs::File;
-use std::io::{BufReader, Cursor, Read};
+use std::collections::{HashMap, HashSet};
+use std::fs::{self, File};
+use std::io::{Cursor, Read};
 use std::path::{Path, PathBuf};
 use std::sync::Mutex;
 use transit_core::{
@@ -19,6 +19,9 @@ use transit_core::{
 };
 use zip::ZipArchive;
 
+/// Read size for the streaming row counts.
+const COUNT_CHUNK_SIZE: usize = 64 * 1024;
+
 /// Source of GTFS data for lazy loading.
 enum GtfsSource {
     /// Directory path containing GTFS files.
@@ -58,20 +61,25 @@ impl LazyGtfsFeed {
     pub fn from_path(path: impl AsRef<Path>) -> Result<Self, ParseError> {
         let path = path.as_ref().to_path_buf();
 
-        // Just check which files exist
-        let has_calendar = path.join("calendar.txt").exists();
-        let has_calendar_dates = path.join("calendar_dates.txt").exists();
-        let has_shapes = path.join("shapes.txt").exists();
+        // List the directory once instead of stat-ing each candidate file.
+        // An unreadable directory behaves like an empty one, so it is
+        // reported as a missing required file as before.
+        let file_names: HashSet<String> = fs::read_dir(&path)
+            .map(|entries| {
+                entries
+                    .filter_map(Result::ok)
+                    .map(|entry| entry.file_name().to_string_lossy().into_owned())
+                    .collect()
+            })
+            .unwrap_or_default();
+
+        let has_calendar = file_names.contains("calendar.txt");
+        let has_calendar_dates = file_names.contains("calendar_dates.txt");
+        let has_shapes = file_names.contains("shapes.txt");
 
         // Verify required files exist
-        for required in &[
-            "agency.txt",
-            "stops.txt",
-            "routes.txt",
-            "trips.txt",
-            "stop_times.txt",
-        ] {
-            if !path.join(required).exists() {
+        for required in REQUIRED_FILES {
+            if !file_names.contains(required) {
                 return Err(ParseError::MissingField(required.to_string()));
             }
         }
@@ -103,10 +111,7 @@ impl LazyGtfsFeed {
     ///
     /// This reads the ZIP file into memory and scans entries - no CSV parsing happens.
     pub fn from_zip(path: impl AsRef<Path>) -> Result<Self, ParseError> {
-        let file = File::open(path.as_ref())?;
-        let reader = BufReader::new(file);
-        let mut bytes = Vec::new();
-        reader.into_inner().read_to_end(&mut bytes)?;
+        let bytes = fs::read(path.as_ref())?;
         Self::from_bytes(bytes)
     }
 
@@ -118,21 +123,19 @@ impl LazyGtfsFeed {
         let cursor = Cursor::new(&bytes);
         let archive = ZipArchive::new(cursor).map_err(|e| ParseError::Zip(e.to_string()))?;
 
-        let file_names: Vec<String> = archive.file_names().map(|s| s.to_string()).collect();
+        // Index member base names once instead of rescanning per file
+        let file_names: HashSet<&str> = archive
+            .file_names()
+            .map(|name| name.rsplit('/').next().unwrap_or(name))
+            .collect();
 
-        let has_calendar = file_names.iter().any(|f| f.ends_with("calendar.txt"));
-        let has_calendar_dates = file_names.iter().any(|f| f.ends_with("calendar_dates.txt"));
-        let has_shapes = file_names.iter().any(|f| f.ends_with("shapes.txt"));
+        let has_calendar = file_names.contains("calendar.txt");
+        let has_calendar_dates = file_names.contains("calendar_dates.txt");
+        let has_shapes = file_names.contains("shapes.txt");
 
         // Verify required files
-        for required in &[
-            "agency.txt",
-            "stops.txt",
-            "routes.txt",
-            "trips.txt",
-            "stop_times.txt",
-        ] {
-            if !file_names.iter().any(|f| f.ends_with(required)) {
+        for required in REQUIRED_FILES {
+            if !file_names.contains(required) {
                 return Err(ParseError::MissingField(required.to_string()));
             }
         }
@@ -244,8 +247,7 @@ impl LazyGtfsFeed {
         match &self.source {
             GtfsSource::Directory(path) => {
                 let file = File::open(path.join(filename))?;
-                let reader = BufReader::new(file);
-                Self::count_csv_records(reader)
+                Self::count_rows(file, COUNT_CHUNK_SIZE)
             }
             GtfsSource::Bytes(bytes) => {
                 let cursor = Cursor::new(bytes);
@@ -254,17 +256,75 @@ impl LazyGtfsFeed {
                 let file = archive
                     .by_name(filename)
                     .map_err(|_| ParseError::MissingField(filename.to_string()))?;
-                Self::count_csv_records(file)
+                Self::count_rows(file, COUNT_CHUNK_SIZE)
             }
         }
     }
 
-    fn count_csv_records<R: Read>(reader: R) -> Result<usize, ParseError> {
-        let mut csv_reader = ReaderBuilder::new().has_headers(true).from_reader(reader);
+    /// Count data rows by scanning fixed-size chunks for line breaks with memchr.
+    ///
+    /// Blank lines are skipped and the header is excluded, matching the CSV
+    /// reader. Memory stays bounded by the chunk size (plus the longest line)
+    /// rather than the file size. Once a quote shows up (a quoted field may
+    /// contain a newline), or the input turns out to use bare carriage-return
+    /// line endings, the rest of the stream is counted with the CSV reader,
+    /// starting from the first line that has not been counted yet.
+    fn count_rows<R: Read>(mut reader: R, chunk_size: usize) -> Result<usize, ParseError> {
+        let is_blank = |line: &[u8]| line.is_empty() || line == b"\r";
+        let mut chunk = vec![0u8; chunk_size];
+        // Unfinished line carried over from the previous chunk
+        let mut pending: Vec<u8> = Vec::new();
+        let mut lines: usize = 0;
+
+        loop {
+            let n = match reader.read(&mut chunk) {
+                Ok(0) => break,
+                Ok(n) => n,
+                Err(e) if e.kind() == std::io::ErrorKind::Interrupted => continue,
+                Err(e) => return Err(e.into()),
+            };
+            let data = &chunk[..n];
+
+            if memchr::memchr(b'"', data).is_some() {
+                pending.extend_from_slice(data);
+                let rest = Cursor::new(pending).chain(reader);
+                return Ok((lines + Self::count_csv_lines(rest)?).saturating_sub(1));
+            }
+
+            let mut start = 0;
+            for end in memchr::memchr_iter(b'\n', data) {
+                if pending.is_empty() {
+                    if !is_blank(&data[start..end]) {
+                        lines += 1;
+                    }
+                } else {
+                    pending.extend_from_slice(&data[start..end]);
+                    if !is_blank(pending.as_slice()) {
+                        lines += 1;
+                    }
+                    pending.clear();
+                }
+                start = end + 1;
+            }
+            pending.extend_from_slice(&data[start..]);
+        }
+
+        // No line feed at all: with bare carriage returns the whole input is
+        // still pending, so let the CSV reader split it.
+        if lines == 0 && memchr::memchr(b'\r', &pending).is_some() {
+            return Ok(Self::count_csv_lines(pending.as_slice())?.saturating_sub(1));
+        }
+        if !is_blank(pending.as_slice()) {
+            lines += 1;
+        }
+
+        Ok(lines.saturating_sub(1))
+    }
 
-        // Count records without deserializing
-        let count = csv_reader.records().count();
-        Ok(count)
+    /// Count non-blank CSV lines, header included, for the `count_rows` fallback.
+    fn count_csv_lines<R: Read>(reader: R) -> Result<usize, ParseError> {
+        let mut csv_reader = ReaderBuilder::new().has_headers(false).from_reader(reader);
+        Ok(csv_reader.records().count())
     }
 
     // ========================================
@@ -678,3 +738,39 @@ impl FromRawLazy for CalendarDate {
 fn parse_gtfs_date(s: &str) -> Result<NaiveDate, ParseError> {
     NaiveDate::parse_from_str(s, "%Y%m%d").map_err(|_| ParseError::InvalidDate(s.to_string()))
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Count with several chunk sizes so lines straddle chunk boundaries.
+    fn count(data: &[u8]) -> usize {
+        let counts: Vec<usize> = [1, 3, 7, COUNT_CHUNK_SIZE]
+            .iter()
+            .map(|&chunk_size| LazyGtfsFeed::count_rows(data, chunk_size).unwrap())
+            .collect();
+        assert!(counts.windows(2).all(|w| w[0] == w[1]), "{:?}", counts);
+        counts[0]
+    }
+
+    #[test]
+    fn test_count_rows_excludes_header_and_blank_lines() {
+        assert_eq!(count(b"id,name\n1,a\n2,b\n"), 2);
+        assert_eq!(count(b"id,name\n1,a\n\n2,b"), 2);
+        assert_eq!(count(b"id,name\r\n1,a\r\n\r\n"), 1);
+        assert_eq!(count(b"id,name\n"), 0);
+        assert_eq!(count(b""), 0);
+    }
+
+    #[test]
+    fn test_count_rows_falls_back_to_csv_for_quotes() {
+        assert_eq!(count(b"id,name\n1,\"multi\nline\"\n2,b\n"), 2);
+        // Quote after rows already counted by the line scan
+        assert_eq!(count(b"id,name\n1,a\n2,b\n3,\"c\nd\"\n\n4,e"), 4);
+    }
+
+    #[test]
+    fn test_count_rows_handles_bare_carriage_returns() {
+        assert_eq!(count(b"id,name\r1,a\r2,b\r"), 2);
+    }
+}
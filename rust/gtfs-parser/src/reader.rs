@@ -5,8 +5,8 @@ use crate::GtfsFeed;
 use chrono::NaiveDate;
 use csv::ReaderBuilder;
 use std::collections::HashMap;
-use std::fs::File;
-use std::io::{BufReader, Read};
+use std::fs::{self, File};
+use std::io::Read;
 use std::path::Path;
 use transit_core::{
     Agency, Calendar, CalendarDate, ExceptionType, LocationType, ParseError, PickupDropoffType,
@@ -15,6 +15,27 @@ use transit_core::{
 };
 use zip::ZipArchive;
 
+/// Files every GTFS feed must contain.
+pub(crate) const REQUIRED_FILES: [&str; 5] = [
+    "agency.txt",
+    "stops.txt",
+    "routes.txt",
+    "trips.txt",
+    "stop_times.txt",
+];
+
+/// Largest buffer pre-allocated from a zip member's declared size.
+///
+/// The size comes from the archive header, so it is only a hint: a corrupt
+/// or hostile archive could otherwise claim gigabytes and abort on
+/// allocation before any data is read. Larger members grow as they are read.
+const MAX_MEMBER_PREALLOC: u64 = 64 * 1024 * 1024;
+
+/// Buffer capacity to reserve for a zip member declaring `size` bytes.
+pub(crate) fn member_capacity(size: u64) -> usize {
+    size.min(MAX_MEMBER_PREALLOC) as usize
+}
+
 /// Options for reading GTFS feeds.
 #[derive(Debug, Clone, Default)]
 pub struct ReadOptions {
@@ -58,10 +79,12 @@ impl GtfsReader {
     }
 
     /// Read a GTFS feed from a ZIP file.
+    ///
+    /// The archive is read into memory in one call so member extraction
+    /// works from a slice instead of seeking through a buffered file.
     pub fn read_zip(path: &Path, options: ReadOptions) -> Result<GtfsFeed, ParseError> {
-        let file = File::open(path)?;
-        let reader = BufReader::new(file);
-        Self::read_zip_archive(reader, options)
+        let bytes = fs::read(path)?;
+        Self::read_bytes(&bytes, options)
     }
 
     /// Read a GTFS feed from bytes (ZIP format).
@@ -75,51 +98,85 @@ impl GtfsReader {
         options: ReadOptions,
     ) -> Result<GtfsFeed, ParseError> {
         let mut archive = ZipArchive::new(reader).map_err(|e| ParseError::Zip(e.to_string()))?;
+
+        // Decompress members up front (the archive reader is not shareable),
+        // then parse each file independently on the rayon pool.
+        let agency_bytes = Self::read_zip_member(&mut archive, "agency.txt")?;
+        let stops_bytes = Self::read_zip_member(&mut archive, "stops.txt")?;
+        let routes_bytes = Self::read_zip_member(&mut archive, "routes.txt")?;
+        let trips_bytes = Self::read_zip_member(&mut archive, "trips.txt")?;
+        let stop_times_bytes = Self::read_zip_member(&mut archive, "stop_times.txt")?;
+        let calendar_bytes = Self::read_zip_member(&mut archive, "calendar.txt").ok();
+        let calendar_dates_bytes = Self::read_zip_member(&mut archive, "calendar_dates.txt").ok();
+        let shapes_bytes = Self::read_zip_member(&mut archive, "shapes.txt").ok();
+
+        let mut agencies: Result<Vec<Agency>, ParseError> = Ok(Vec::new());
+        let mut stops: Result<Vec<Stop>, ParseError> = Ok(Vec::new());
+        let mut routes: Result<Vec<Route>, ParseError> = Ok(Vec::new());
+        let mut trips: Result<Vec<Trip>, ParseError> = Ok(Vec::new());
+        let mut stop_times: Result<Vec<StopTime>, ParseError> = Ok(Vec::new());
+        let mut calendars: Option<Result<Vec<Calendar>, ParseError>> = None;
+        let mut calendar_dates: Option<Result<Vec<CalendarDate>, ParseError>> = None;
+        let mut shapes: Option<Result<Vec<Shape>, ParseError>> = None;
+
+        let options = &options;
+        rayon::scope(|s| {
+            s.spawn(|_| agencies = Self::parse_csv(agency_bytes.as_slice(), options));
+            s.spawn(|_| stops = Self::parse_csv(stops_bytes.as_slice(), options));
+            s.spawn(|_| routes = Self::parse_csv(routes_bytes.as_slice(), options));
+            s.spawn(|_| trips = Self::parse_csv(trips_bytes.as_slice(), options));
+            s.spawn(|_| stop_times = Self::parse_csv(stop_times_bytes.as_slice(), options));
+            s.spawn(|_| {
+                calendars = calendar_bytes
+                    .as_deref()
+                    .map(|b| Self::parse_csv(b, options))
+            });
+            s.spawn(|_| {
+                calendar_dates = calendar_dates_bytes
+                    .as_deref()
+                    .map(|b| Self::parse_csv(b, options))
+            });
+            s.spawn(|_| shapes = shapes_bytes.as_deref().map(|b| Self::parse_csv(b, options)));
+        });
+
         let mut feed = TransitFeed::new();
 
-        // Read required files
-        feed.agencies = Self::read_csv_from_zip(&mut archive, "agency.txt", &options)?;
-        feed.stops = Self::read_csv_from_zip(&mut archive, "stops.txt", &options)?;
-        feed.routes = Self::read_csv_from_zip(&mut archive, "routes.txt", &options)?;
-        feed.trips = Self::read_csv_from_zip(&mut archive, "trips.txt", &options)?;
-        feed.stop_times = Self::read_csv_from_zip(&mut archive, "stop_times.txt", &options)?;
+        // Required files
+        feed.agencies = agencies?;
+        feed.stops = stops?;
+        feed.routes = routes?;
+        feed.trips = trips?;
+        feed.stop_times = stop_times?;
 
         // Calendar files (at least one required)
-        if let Ok(calendars) =
-            Self::read_csv_from_zip::<_, Calendar>(&mut archive, "calendar.txt", &options)
-        {
+        if let Some(Ok(calendars)) = calendars {
             feed.calendars = calendars;
         }
-        if let Ok(dates) =
-            Self::read_csv_from_zip::<_, CalendarDate>(&mut archive, "calendar_dates.txt", &options)
-        {
+        if let Some(Ok(dates)) = calendar_dates {
             feed.calendar_dates = dates;
         }
 
         // Optional files
-        if let Ok(shapes) =
-            Self::read_csv_from_zip::<_, Shape>(&mut archive, "shapes.txt", &options)
-        {
+        if let Some(Ok(shapes)) = shapes {
             feed.shapes = shapes;
         }
 
         Ok(GtfsFeed { feed })
     }
 
-    fn read_csv_from_zip<R: Read + std::io::Seek, T>(
+    fn read_zip_member<R: Read + std::io::Seek>(
         archive: &mut ZipArchive<R>,
         filename: &str,
-        options: &ReadOptions,
-    ) -> Result<Vec<T>, ParseError>
-    where
-        T: FromRaw,
-        T::Raw: for<'de> serde::Deserialize<'de>,
-    {
-        let file = archive
+    ) -> Result<Vec<u8>, ParseError> {
+        let mut file = archive
             .by_name(filename)
             .map_err(|_| ParseError::MissingField(filename.to_string()))?;
 
-        Self::parse_csv(file, options)
+        // Size the buffer from the central directory so decompression
+        // usually writes into a single allocation.
+        let mut bytes = Vec::with_capacity(member_capacity(file.size()));
+        file.read_to_end(&mut bytes)?;
+        Ok(bytes)
     }
 
     fn read_agencies(path: &Path, options: &ReadOptions) -> Result<Vec<Agency>, ParseError> {
@@ -411,3 +468,14 @@ impl FromRaw for Shape {
 fn parse_gtfs_date(s: &str) -> Result<NaiveDate, ParseError> {
     NaiveDate::parse_from_str(s, "%Y%m%d").map_err(|_| ParseError::InvalidDate(s.to_string()))
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_member_capacity_is_capped() {
+        assert_eq!(member_capacity(1024), 1024);
+        assert_eq!(member_capacity(u64::MAX), MAX_MEMBER_PREALLOC as usize);
+    }
+}
@@ -63,63 +63,58 @@ impl GtfsWriter {
 
     /// Write a GTFS feed to bytes (ZIP format).
     pub fn write_bytes(feed: &TransitFeed, _options: WriteOptions) -> Result<Vec<u8>, ParseError> {
+        // Serialize member CSVs in parallel; only the archive writes below
+        // need to happen in order.
+        let mut agency_csv: Result<String, ParseError> = Ok(String::new());
+        let mut stops_csv: Result<String, ParseError> = Ok(String::new());
+        let mut routes_csv: Result<String, ParseError> = Ok(String::new());
+        let mut trips_csv: Result<String, ParseError> = Ok(String::new());
+        let mut stop_times_csv: Result<String, ParseError> = Ok(String::new());
+        let mut calendars_csv: Option<Result<String, ParseError>> = None;
+        let mut calendar_dates_csv: Option<Result<String, ParseError>> = None;
+        let mut shapes_csv: Option<Result<String, ParseError>> = None;
+
+        rayon::scope(|s| {
+            s.spawn(|_| agency_csv = Self::agencies_to_csv(&feed.agencies));
+            s.spawn(|_| stops_csv = Self::stops_to_csv(&feed.stops));
+            s.spawn(|_| routes_csv = Self::routes_to_csv(&feed.routes));
+            s.spawn(|_| trips_csv = Self::trips_to_csv(&feed.trips));
+            s.spawn(|_| stop_times_csv = Self::stop_times_to_csv(&feed.stop_times));
+            s.spawn(|_| {
+                calendars_csv =
+                    (!feed.calendars.is_empty()).then(|| Self::calendars_to_csv(&feed.calendars))
+            });
+            s.spawn(|_| {
+                calendar_dates_csv = (!feed.calendar_dates.is_empty())
+                    .then(|| Self::calendar_dates_to_csv(&feed.calendar_dates))
+            });
+            s.spawn(|_| {
+                shapes_csv = (!feed.shapes.is_empty()).then(|| Self::shapes_to_csv(&feed.shapes))
+            });
+        });
+
+        let members = [
+            ("agency.txt", Some(agency_csv?)),
+            ("stops.txt", Some(stops_csv?)),
+            ("routes.txt", Some(routes_csv?)),
+            ("trips.txt", Some(trips_csv?)),
+            ("stop_times.txt", Some(stop_times_csv?)),
+            ("calendar.txt", calendars_csv.transpose()?),
+            ("calendar_dates.txt", calendar_dates_csv.transpose()?),
+            ("shapes.txt", shapes_csv.transpose()?),
+        ];
+
         let mut buffer = Cursor::new(Vec::new());
         {
             let mut zip = ZipWriter::new(&mut buffer);
             let file_options = SimpleFileOptions::default();
 
-            // agency.txt
-            zip.start_file("agency.txt", file_options)
-                .map_err(|e| ParseError::Zip(e.to_string()))?;
-            let agency_csv = Self::agencies_to_csv(&feed.agencies)?;
-            zip.write_all(agency_csv.as_bytes())?;
-
-            // stops.txt
-            zip.start_file("stops.txt", file_options)
-                .map_err(|e| ParseError::Zip(e.to_string()))?;
-            let stops_csv = Self::stops_to_csv(&feed.stops)?;
-            zip.write_all(stops_csv.as_bytes())?;
-
-            // routes.txt
-            zip.start_file("routes.txt", file_options)
-                .map_err(|e| ParseError::Zip(e.to_string()))?;
-            let routes_csv = Self::routes_to_csv(&feed.routes)?;
-            zip.write_all(routes_csv.as_bytes())?;
-
-            // trips.txt
-            zip.start_file("trips.txt", file_options)
-                .map_err(|e| ParseError::Zip(e.to_string()))?;
-            let trips_csv = Self::trips_to_csv(&feed.trips)?;
-            zip.write_all(trips_csv.as_bytes())?;
-
-            // stop_times.txt
-            zip.start_file("stop_times.txt", file_options)
-                .map_err(|e| ParseError::Zip(e.to_string()))?;
-            let stop_times_csv = Self::stop_times_to_csv(&feed.stop_times)?;
-            zip.write_all(stop_times_csv.as_bytes())?;
-
-            // calendar.txt
-            if !feed.calendars.is_empty() {
-                zip.start_file("calendar.txt", file_options)
-                    .map_err(|e| ParseError::Zip(e.to_string()))?;
-                let calendars_csv = Self::calendars_to_csv(&feed.calendars)?;
-                zip.write_all(calendars_csv.as_bytes())?;
-            }
-
-            // calendar_dates.txt
-            if !feed.calendar_dates.is_empty() {
-                zip.start_file("calendar_dates.txt", file_options)
-                    .map_err(|e| ParseError::Zip(e.to_string()))?;
-                let calendar_dates_csv = Self::calendar_dates_to_csv(&feed.calendar_dates)?;
-                zip.write_all(calendar_dates_csv.as_bytes())?;
-            }
-
-            // shapes.txt
-            if !feed.shapes.is_empty() {
-                zip.start_file("shapes.txt", file_options)
-                    .map_err(|e| ParseError::Zip(e.to_string()))?;
-                let shapes_csv = Self::shapes_to_csv(&feed.shapes)?;
-                zip.write_all(shapes_csv.as_bytes())?;
+            for (name, csv) in members {
+                if let Some(csv) = csv {
+                    zip.start_file(name, file_options)
+                        .map_err(|e| ParseError::Zip(e.to_string()))?;
+                    zip.write_all(csv.as_bytes())?;
+                }
             }
 
             zip.finish().map_err(|e| ParseError::Zip(e.to_string()))?;
@@ -1,8 +1,10 @@
 //! CSV Python bindings.
 
+use crate::json::value_to_py;
 use csv_parser::CsvDocument;
-use pyo3::exceptions::PyIOError;
+use pyo3::exceptions::{PyIOError, PyIndexError, PyKeyError};
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList, PyString};
 
 /// Python wrapper for CSV document.
 #[pyclass(name = "CsvDocument")]
@@ -76,15 +78,47 @@ impl PyCsvDocument {
 
     /// Get rows as list of dicts.
     #[getter]
-    fn rows(&self) -> PyResult<PyObject> {
-        Python::with_gil(|py| {
-            let json_str = serde_json::to_string(&self.inner.rows)
-                .map_err(|e| PyIOError::new_err(e.to_string()))?;
+    fn rows(&self, py: Python<'_>) -> PyResult<PyObject> {
+        let names: Vec<Bound<'_, PyString>> = self
+            .inner
+            .schema
+            .columns
+            .iter()
+            .map(|c| PyString::new(py, &c.name))
+            .collect();
+        let list = PyList::empty(py);
+        for index in 0..self.inner.len() {
+            let dict = PyDict::new(py);
+            for (name, values) in names.iter().zip(&self.inner.columns) {
+                dict.set_item(name, value_to_py(py, &values[index])?)?;
+            }
+            list.append(dict)?;
+        }
+        Ok(list.into_any().unbind())
+    }
+
+    /// Get all values of a column by name.
+    fn column(&self, py: Python<'_>, name: &str) -> PyResult<PyObject> {
+        let values = self
+            .inner
+            .column(name)
+            .ok_or_else(|| PyKeyError::new_err(name.to_string()))?;
+        let list = PyList::empty(py);
+        for value in values {
+            list.append(value_to_py(py, value)?)?;
+        }
+        Ok(list.into_any().unbind())
+    }
 
-            let json_module = py.import("json")?;
-            let result = json_module.call_method1("loads", (json_str,))?;
-            Ok(result.into())
-        })
+    /// Get a single row as a dict, assembled on demand.
+    fn __getitem__(&self, py: Python<'_>, index: isize) -> PyResult<PyObject> {
+        let len = self.inner.len() as isize;
+        let resolved = if index < 0 { index + len } else { index };
+        let row = usize::try_from(resolved)
+            .ok()
+            .and_then(|i| self.inner.row(i))
+            .ok_or_else(|| PyIndexError::new_err("CSV row index out of range"))?;
+        value_to_py(py, &row).map(Bound::unbind)
     }
 
     fn __repr__(&self) -> String {
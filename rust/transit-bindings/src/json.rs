@@ -1,8 +1,47 @@
 //! JSON Python bindings.
 
 use json_parser::JsonDocument;
-use pyo3::exceptions::PyIOError;
+use pyo3::exceptions::{PyIOError, PyIndexError, PyKeyError, PyTypeError};
 use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyDict, PyList, PyString};
+use pyo3::IntoPyObject;
+use serde_json::Value;
+
+/// Convert a JSON value into native Python objects.
+///
+/// Builds the objects directly from the parsed tree rather than
+/// re-serializing and going through the `json` module, so callers that
+/// only touch a subtree only pay for that subtree.
+pub(crate) fn value_to_py<'py>(py: Python<'py>, value: &Value) -> PyResult<Bound<'py, PyAny>> {
+    match value {
+        Value::Null => Ok(py.None().into_bound(py)),
+        Value::Bool(b) => Ok(PyBool::new(py, *b).to_owned().into_any()),
+        Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                Ok(i.into_pyobject(py)?.into_any())
+            } else if let Some(u) = n.as_u64() {
+                Ok(u.into_pyobject(py)?.into_any())
+            } else {
+                Ok(n.as_f64().unwrap_or(f64::NAN).into_pyobject(py)?.into_any())
+            }
+        }
+        Value::String(s) => Ok(PyString::new(py, s).into_any()),
+        Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(value_to_py(py, item)?)?;
+            }
+            Ok(list.into_any())
+        }
+        Value::Object(map) => {
+            let dict = PyDict::new(py);
+            for (key, item) in map {
+                dict.set_item(key, value_to_py(py, item)?)?;
+            }
+            Ok(dict.into_any())
+        }
+    }
+}
 
 /// Python wrapper for JSON document.
 #[pyclass(name = "JsonDocument")]
@@ -69,30 +108,53 @@ impl PyJsonDocument {
 
     /// Get the root value as Python object.
     #[getter]
-    fn root(&self) -> PyResult<PyObject> {
-        Python::with_gil(|py| {
-            let json_str = serde_json::to_string(&self.inner.root)
-                .map_err(|e| PyIOError::new_err(e.to_string()))?;
-
-            let json_module = py.import("json")?;
-            let result = json_module.call_method1("loads", (json_str,))?;
-            Ok(result.into())
-        })
+    fn root(&self, py: Python<'_>) -> PyResult<PyObject> {
+        value_to_py(py, &self.inner.root).map(Bound::unbind)
     }
 
     /// Get a value by JSON pointer.
-    fn pointer(&self, path: &str) -> PyResult<Option<PyObject>> {
-        Python::with_gil(|py| match self.inner.pointer(path) {
-            Some(value) => {
-                let json_str =
-                    serde_json::to_string(value).map_err(|e| PyIOError::new_err(e.to_string()))?;
-
-                let json_module = py.import("json")?;
-                let result = json_module.call_method1("loads", (json_str,))?;
-                Ok(Some(result.into()))
+    fn pointer(&self, py: Python<'_>, path: &str) -> PyResult<Option<PyObject>> {
+        self.inner
+            .pointer(path)
+            .map(|value| value_to_py(py, value).map(Bound::unbind))
+            .transpose()
+    }
+
+    /// Get the keys of the root object.
+    fn keys(&self) -> PyResult<Vec<String>> {
+        match &self.inner.root {
+            Value::Object(map) => Ok(map.keys().cloned().collect()),
+            _ => Err(PyTypeError::new_err("JSON root is not an object")),
+        }
+    }
+
+    fn __len__(&self) -> PyResult<usize> {
+        match &self.inner.root {
+            Value::Object(map) => Ok(map.len()),
+            Value::Array(items) => Ok(items.len()),
+            _ => Err(PyTypeError::new_err("JSON root is not an object or array")),
+        }
+    }
+
+    /// Index into the root, converting only the selected subtree.
+    fn __getitem__(&self, py: Python<'_>, key: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        let value = match &self.inner.root {
+            Value::Object(map) => {
+                let name: String = key.extract()?;
+                map.get(&name).ok_or_else(|| PyKeyError::new_err(name))?
+            }
+            Value::Array(items) => {
+                let index: isize = key.extract()?;
+                let len = items.len() as isize;
+                let resolved = if index < 0 { index + len } else { index };
+                if resolved < 0 || resolved >= len {
+                    return Err(PyIndexError::new_err("JSON array index out of range"));
+                }
+                &items[resolved as usize]
             }
-            None => Ok(None),
-        })
+            _ => return Err(PyTypeError::new_err("JSON root is not an object or array")),
+        };
+        value_to_py(py, value).map(Bound::unbind)
     }
 
     fn __repr__(&self) -> String {
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 if TYPE_CHECKING:
-    from transit_parser import GtfsFeed, LazyGtfsFeed, TxcDocument
+    from transit_parser import ConversionResult, GtfsFeed, LazyGtfsFeed, TxcDocument
+    from transit_parser.filtering import GtfsFilter
 
 
 # Get the fixtures directory
@@ -30,31 +31,91 @@ def txc_fixtures_dir() -> Path:
     return TXC_FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_gtfs_feed() -> "GtfsFeed":
-    """Load the sample GTFS feed from fixtures."""
+    """Load the sample GTFS feed from fixtures, once per test session.
+
+    Tests must treat the feed as read-only.
+    """
     from transit_parser import GtfsFeed
 
     return GtfsFeed.from_path(str(GTFS_FIXTURES_DIR))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_lazy_gtfs_feed() -> "LazyGtfsFeed":
-    """Load the sample GTFS feed lazily from fixtures."""
+    """Load the sample GTFS feed lazily from fixtures, once per test session.
+
+    Tables parsed by one test stay cached for the next; tests that check
+    first-access behaviour should load their own feed.
+    """
     from transit_parser import LazyGtfsFeed
 
     return LazyGtfsFeed.from_path(str(GTFS_FIXTURES_DIR))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def gtfs_by_id(sample_gtfs_feed: GtfsFeed) -> dict[str, dict[str, Any]]:
+    """The sample feed's entities keyed by ID, for direct lookups in tests.
+
+    Maps "agencies", "stops", "routes" and "trips" by ``id`` and
+    "calendars" by ``service_id``.
+    """
+    feed = sample_gtfs_feed
+    return {
+        "agencies": {a.id: a for a in feed.agencies},
+        "stops": {s.id: s for s in feed.stops},
+        "routes": {r.id: r for r in feed.routes},
+        "trips": {t.id: t for t in feed.trips},
+        "calendars": {c.service_id: c for c in feed.calendars},
+    }
+
+
+@pytest.fixture(scope="session")
+def filter_ro(sample_gtfs_feed: GtfsFeed) -> GtfsFilter:
+    """A GtfsFilter over the sample feed with its lookup indexes already built.
+
+    Shared across the session, so tests must only query it; use a fresh
+    GtfsFilter to test index construction itself.
+    """
+    from transit_parser.filtering import GtfsFilter
+
+    f = GtfsFilter(sample_gtfs_feed)
+    f.get_stop("__warm__")
+    f.get_route("__warm__")
+    f.get_trip("__warm__")
+    f.get_agency("__warm__")
+    f.get_calendar("__warm__")
+    return f
+
+
+@pytest.fixture(scope="session")
 def sample_txc_document() -> "TxcDocument":
-    """Load the sample TXC document from fixtures."""
+    """Load the sample TXC document from fixtures, once per test session."""
     from transit_parser import TxcDocument
 
     txc_file = TXC_FIXTURES_DIR / "sample_service.xml"
     return TxcDocument.from_path(str(txc_file))
 
 
+@pytest.fixture(scope="session")
+def converted_result(sample_txc_document: TxcDocument) -> ConversionResult:
+    """Convert the sample TXC document to GTFS, once per test session."""
+    from transit_parser import TxcToGtfsConverter
+
+    return TxcToGtfsConverter().convert(sample_txc_document)
+
+
+@pytest.fixture(scope="session")
+def converted_gtfs_dir(
+    tmp_path_factory: pytest.TempPathFactory, converted_result: ConversionResult
+) -> Path:
+    """Write the converted sample feed to a directory, once per test session."""
+    output_dir = tmp_path_factory.mktemp("converted_gtfs")
+    converted_result.feed.to_path(str(output_dir))
+    return output_dir
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for test outputs."""
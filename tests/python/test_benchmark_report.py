@@ -0,0 +1,53 @@
+"""Unit tests for loading pytest-benchmark exports into the benchmark report."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.run_benchmarks import generate_report, load_pytest_benchmark_json
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "benchmarks" / "pytest_benchmark.json"
+
+
+class TestLoadPytestBenchmarkJson:
+    """Tests for load_pytest_benchmark_json."""
+
+    @pytest.fixture
+    def categories(self):
+        return {cat.name: cat for cat in load_pytest_benchmark_json(FIXTURE)}
+
+    def test_groups_become_categories(self, categories) -> None:
+        """Test that CSV and JSON results land in their own categories."""
+        assert set(categories) == {"CSV parsing", "JSON parsing", "bench_misc"}
+        assert [r.name for r in categories["CSV parsing"].results] == [
+            "test_csv_parse",
+            "test_csv_stdlib",
+        ]
+
+    def test_library_from_extra_info(self, categories) -> None:
+        """Test that tagged benchmarks keep their library and the rest are ours."""
+        libraries = {r.name: r.library for r in categories["CSV parsing"].results}
+        assert libraries == {"test_csv_parse": "transit-parser", "test_csv_stdlib": "csv (stdlib)"}
+        assert categories["bench_misc"].results[0].library == "transit-parser"
+
+    def test_stats_converted_to_ms(self, categories) -> None:
+        """Test that times are converted from seconds to milliseconds."""
+        result = categories["CSV parsing"].results[1]
+        assert result.median_ms == pytest.approx(5.0)
+        assert result.times == pytest.approx((4.0, 5.0, 6.0))
+        assert categories["bench_misc"].results[0].times == ()
+
+    def test_unreliable_flag(self, categories) -> None:
+        """Test that the unreliable flag round-trips through extra_info."""
+        results = {r.name: r for r in categories["JSON parsing"].results}
+        assert results["test_json_orjson"].unreliable
+        assert not results["test_json_parse"].unreliable
+
+    def test_report_key_findings(self, categories) -> None:
+        """Test that the report compares transit-parser against each baseline."""
+        report = generate_report(list(categories.values()))
+        assert "CSV parsing" in report
+        assert "csv (stdlib)" in report
+        assert "`transit-parser` is **2.5x faster** than `csv (stdlib)`" in report
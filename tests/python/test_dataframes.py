@@ -0,0 +1,53 @@
+"""Unit tests for the optional pandas DataFrame support."""
+
+from __future__ import annotations
+
+import pytest
+from transit_parser.dataframes import GtfsDataFrames, to_dataframes
+
+pd = pytest.importorskip("pandas")
+
+
+def _is_plain_string(series: pd.Series) -> bool:
+    """Whether a column holds strings without categorical encoding.
+
+    pandas 3 infers its ``str`` dtype where older versions use ``object``.
+    """
+    dtype = series.dtype
+    return not isinstance(dtype, pd.CategoricalDtype) and pd.api.types.is_string_dtype(dtype)
+
+
+class TestGtfsDataFramesDtypes:
+    """Tests for the dtypes of the ID columns."""
+
+    def test_id_columns_default_to_strings(self, sample_gtfs_feed) -> None:
+        """Test that ID columns are plain string columns by default."""
+        dfs = to_dataframes(sample_gtfs_feed)
+
+        for column in ["trip_id", "route_id", "service_id"]:
+            assert _is_plain_string(dfs.trips[column])
+        for column in ["trip_id", "stop_id"]:
+            assert _is_plain_string(dfs.stop_times[column])
+
+    def test_categorical_id_columns(self, sample_gtfs_feed) -> None:
+        """Test that categorical=True stores repeated IDs as categoricals."""
+        dfs = to_dataframes(sample_gtfs_feed, categorical=True)
+
+        assert isinstance(dfs.trips["route_id"].dtype, pd.CategoricalDtype)
+        assert isinstance(dfs.trips["service_id"].dtype, pd.CategoricalDtype)
+        assert _is_plain_string(dfs.trips["trip_id"])
+        assert isinstance(dfs.stop_times["trip_id"].dtype, pd.CategoricalDtype)
+        assert isinstance(dfs.stop_times["stop_id"].dtype, pd.CategoricalDtype)
+
+    def test_categorical_values_match(self, sample_gtfs_feed) -> None:
+        """Test that categorical columns hold the same values."""
+        plain = to_dataframes(sample_gtfs_feed)
+        categorical = to_dataframes(sample_gtfs_feed, categorical=True)
+
+        assert list(categorical.stop_times["stop_id"]) == list(plain.stop_times["stop_id"])
+
+    def test_from_path_passes_categorical(self, gtfs_fixtures_dir) -> None:
+        """Test that from_path forwards the categorical option."""
+        dfs = GtfsDataFrames.from_path(str(gtfs_fixtures_dir), categorical=True)
+
+        assert isinstance(dfs.stop_times["stop_id"].dtype, pd.CategoricalDtype)
@@ -3,6 +3,23 @@
 from __future__ import annotations
 
 import pytest
+from transit_parser import (
+    CalendarConversionError,
+    ConversionError,
+    FilterError,
+    GtfsError,
+    GtfsFileNotFoundError,
+    GtfsParseError,
+    GtfsValidationError,
+    InvalidDateError,
+    MappingError,
+    TransitParserError,
+    TxcError,
+    TxcFileNotFoundError,
+    TxcParseError,
+    TxcValidationError,
+)
+from transit_parser.filtering import GtfsFilter
 
 
 class TestExceptionHierarchy:
@@ -10,23 +27,6 @@ class TestExceptionHierarchy:
 
     def test_all_exceptions_inherit_from_base(self) -> None:
         """Test that all exceptions inherit from TransitParserError."""
-        from transit_parser import (
-            CalendarConversionError,
-            ConversionError,
-            FilterError,
-            GtfsError,
-            GtfsFileNotFoundError,
-            GtfsParseError,
-            GtfsValidationError,
-            InvalidDateError,
-            MappingError,
-            TransitParserError,
-            TxcError,
-            TxcFileNotFoundError,
-            TxcParseError,
-            TxcValidationError,
-        )
-
         # All should be subclasses of TransitParserError
         assert issubclass(GtfsError, TransitParserError)
         assert issubclass(GtfsFileNotFoundError, TransitParserError)
@@ -44,26 +44,12 @@ class TestExceptionHierarchy:
 
     def test_gtfs_exceptions_inherit_from_gtfs_error(self) -> None:
         """Test that GTFS exceptions inherit from GtfsError."""
-        from transit_parser import (
-            GtfsError,
-            GtfsFileNotFoundError,
-            GtfsParseError,
-            GtfsValidationError,
-        )
-
         assert issubclass(GtfsFileNotFoundError, GtfsError)
         assert issubclass(GtfsValidationError, GtfsError)
         assert issubclass(GtfsParseError, GtfsError)
 
     def test_txc_exceptions_inherit_from_txc_error(self) -> None:
         """Test that TXC exceptions inherit from TxcError."""
-        from transit_parser import (
-            TxcError,
-            TxcFileNotFoundError,
-            TxcParseError,
-            TxcValidationError,
-        )
-
         assert issubclass(TxcFileNotFoundError, TxcError)
         assert issubclass(TxcValidationError, TxcError)
         assert issubclass(TxcParseError, TxcError)
@@ -74,8 +60,6 @@ class TestExceptionAttributes:
 
     def test_gtfs_file_not_found_attributes(self) -> None:
         """Test GtfsFileNotFoundError attributes."""
-        from transit_parser import GtfsFileNotFoundError
-
         exc = GtfsFileNotFoundError(
             "Feed not found",
             path="/path/to/gtfs",
@@ -88,8 +72,6 @@ class TestExceptionAttributes:
 
     def test_gtfs_validation_error_attributes(self) -> None:
         """Test GtfsValidationError attributes."""
-        from transit_parser import GtfsValidationError
-
         exc = GtfsValidationError(
             "Validation failed",
             errors=["Missing required field"],
@@ -101,8 +83,6 @@ class TestExceptionAttributes:
 
     def test_gtfs_parse_error_attributes(self) -> None:
         """Test GtfsParseError attributes."""
-        from transit_parser import GtfsParseError
-
         exc = GtfsParseError(
             "Parse error",
             file_name="stops.txt",
@@ -116,8 +96,6 @@ class TestExceptionAttributes:
 
     def test_invalid_date_error_attributes(self) -> None:
         """Test InvalidDateError attributes."""
-        from transit_parser import InvalidDateError
-
         exc = InvalidDateError(
             "Invalid date",
             date_string="not-a-date",
@@ -133,23 +111,16 @@ class TestExceptionUsage:
 
     def test_catch_all_transit_errors(self) -> None:
         """Test catching all transit errors with base class."""
-        from transit_parser import GtfsFileNotFoundError, TransitParserError
-
         with pytest.raises(TransitParserError):
             raise GtfsFileNotFoundError("Feed not found")
 
     def test_catch_specific_gtfs_error(self) -> None:
         """Test catching specific GTFS errors."""
-        from transit_parser import GtfsError, GtfsFileNotFoundError
-
         with pytest.raises(GtfsError):
             raise GtfsFileNotFoundError("Feed not found")
 
     def test_invalid_date_raised_by_filter(self, sample_gtfs_feed) -> None:
         """Test that InvalidDateError is raised for invalid dates."""
-        from transit_parser import InvalidDateError
-        from transit_parser.filtering import GtfsFilter
-
         f = GtfsFilter(sample_gtfs_feed)
 
         with pytest.raises(InvalidDateError) as exc_info:
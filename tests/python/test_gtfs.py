@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from transit_parser import GtfsFeed
 
 
 class TestGtfsFeed:
@@ -12,12 +13,10 @@ class TestGtfsFeed:
 
     def test_load_from_directory(self, gtfs_fixtures_dir: Path) -> None:
         """Test loading a GTFS feed from a directory."""
-        from transit_parser import GtfsFeed
-
         feed = GtfsFeed.from_path(str(gtfs_fixtures_dir))
         assert feed is not None
 
-    def test_agencies_loaded(self, sample_gtfs_feed) -> None:
+    def test_agencies_loaded(self, sample_gtfs_feed, gtfs_by_id) -> None:
         """Test that agencies are loaded correctly."""
         agencies = sample_gtfs_feed.agencies
         assert len(agencies) == 2
@@ -28,12 +27,12 @@ class TestGtfsFeed:
         assert "agency_2" in agency_ids
 
         # Check agency details (attributes are 'name', 'url', 'timezone')
-        agency_1 = next(a for a in agencies if a.id == "agency_1")
+        agency_1 = gtfs_by_id["agencies"]["agency_1"]
         assert agency_1.name == "Test Transit Agency"
         assert agency_1.url == "https://example.com"
         assert agency_1.timezone == "America/New_York"
 
-    def test_stops_loaded(self, sample_gtfs_feed) -> None:
+    def test_stops_loaded(self, sample_gtfs_feed, gtfs_by_id) -> None:
         """Test that stops are loaded correctly."""
         stops = sample_gtfs_feed.stops
         assert len(stops) == 5
@@ -45,12 +44,12 @@ class TestGtfsFeed:
         assert "stop_5" in stop_ids  # Child station (Platform 1)
 
         # Check stop with coordinates
-        stop_1 = next(s for s in stops if s.id == "stop_1")
+        stop_1 = gtfs_by_id["stops"]["stop_1"]
         assert stop_1.name == "Main Street Station"
         assert abs(stop_1.latitude - 40.712776) < 0.0001
         assert abs(stop_1.longitude - (-74.005974)) < 0.0001
 
-    def test_routes_loaded(self, sample_gtfs_feed) -> None:
+    def test_routes_loaded(self, sample_gtfs_feed, gtfs_by_id) -> None:
         """Test that routes are loaded correctly."""
         routes = sample_gtfs_feed.routes
         assert len(routes) == 3
@@ -62,12 +61,12 @@ class TestGtfsFeed:
         assert "route_3" in route_ids
 
         # Check route details
-        route_1 = next(r for r in routes if r.id == "route_1")
+        route_1 = gtfs_by_id["routes"]["route_1"]
         assert route_1.short_name == "1"
         assert route_1.long_name == "Main Line"
         assert route_1.route_type == 3  # Bus
 
-    def test_trips_loaded(self, sample_gtfs_feed) -> None:
+    def test_trips_loaded(self, sample_gtfs_feed, gtfs_by_id) -> None:
         """Test that trips are loaded correctly."""
         trips = sample_gtfs_feed.trips
         assert len(trips) == 5
@@ -79,7 +78,7 @@ class TestGtfsFeed:
         assert "trip_5" in trip_ids
 
         # Check trip details
-        trip_1 = next(t for t in trips if t.id == "trip_1")
+        trip_1 = gtfs_by_id["trips"]["trip_1"]
         assert trip_1.route_id == "route_1"
         assert trip_1.service_id == "weekday"
         assert trip_1.headsign == "Northbound to Central"
@@ -97,7 +96,7 @@ class TestGtfsFeed:
         sequences = sorted(st.stop_sequence for st in trip_1_times)
         assert sequences == [1, 2, 3, 4]
 
-    def test_calendars_loaded(self, sample_gtfs_feed) -> None:
+    def test_calendars_loaded(self, sample_gtfs_feed, gtfs_by_id) -> None:
         """Test that calendar entries are loaded correctly."""
         # Property is 'calendars', not 'calendar'
         calendars = sample_gtfs_feed.calendars
@@ -108,7 +107,7 @@ class TestGtfsFeed:
         assert "weekend" in service_ids
 
         # Days are booleans (True/False), not integers
-        weekday = next(c for c in calendars if c.service_id == "weekday")
+        weekday = gtfs_by_id["calendars"]["weekday"]
         assert weekday.monday is True
         assert weekday.saturday is False
         assert weekday.sunday is False
@@ -146,15 +145,11 @@ class TestGtfsFeedEdgeCases:
 
     def test_nonexistent_path_raises_error(self) -> None:
         """Test that loading from a nonexistent path raises an error."""
-        from transit_parser import GtfsFeed
-
         with pytest.raises(Exception):
             GtfsFeed.from_path("/nonexistent/path")
 
     def test_empty_directory_raises_error(self, tmp_path: Path) -> None:
         """Test that loading from an empty directory raises an error."""
-        from transit_parser import GtfsFeed
-
         empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
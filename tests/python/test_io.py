@@ -0,0 +1,168 @@
+"""Unit tests for the generic CSV and JSON documents."""
+
+from __future__ import annotations
+
+import pytest
+from transit_parser import CsvDocument, JsonDocument
+
+SAMPLE_CSV = """stop_id,stop_name,stop_sequence,shape_dist,timepoint,service_date
+stop_1,Main Street,1,0.0,true,2025-01-06
+stop_2,Oak Avenue,2,1.5,false,2025-01-06
+stop_3,,3,2,true,2025-01-07
+"""
+
+SAMPLE_JSON = """{
+    "name": "Sample",
+    "count": 3,
+    "ratio": 0.5,
+    "active": true,
+    "missing": null,
+    "stops": [
+        {"id": "stop_1", "coords": [51.5, -0.12]},
+        {"id": "stop_2", "coords": [51.6, -0.13]}
+    ]
+}"""
+
+
+class TestCsvDocumentColumns:
+    """Tests for column and row access on a CSV document."""
+
+    @pytest.fixture
+    def doc(self) -> CsvDocument:
+        return CsvDocument.from_string(SAMPLE_CSV)
+
+    def test_column_by_name(self, doc: CsvDocument) -> None:
+        """Test getting all values of a known column."""
+        assert doc.column("stop_id") == ["stop_1", "stop_2", "stop_3"]
+
+    def test_unknown_column_raises(self, doc: CsvDocument) -> None:
+        """Test that an unknown column name raises KeyError."""
+        with pytest.raises(KeyError):
+            doc.column("nope")
+
+    def test_typed_columns(self, doc: CsvDocument) -> None:
+        """Test that each column's inferred type is applied to its values."""
+        assert doc.column("stop_sequence") == [1, 2, 3]
+        assert all(isinstance(v, int) for v in doc.column("stop_sequence"))
+        # A column mixing integers and floats is read as floats
+        assert doc.column("shape_dist") == [0.0, 1.5, 2.0]
+        assert all(isinstance(v, float) for v in doc.column("shape_dist"))
+        assert doc.column("timepoint") == [True, False, True]
+        # Dates stay strings
+        assert doc.column("service_date") == ["2025-01-06", "2025-01-06", "2025-01-07"]
+
+    def test_empty_cells_are_none(self, doc: CsvDocument) -> None:
+        """Test that empty cells read as None."""
+        assert doc.column("stop_name") == ["Main Street", "Oak Avenue", None]
+
+    def test_getitem_row(self, doc: CsvDocument) -> None:
+        """Test that indexing assembles a single row as a dict."""
+        assert doc[1] == {
+            "stop_id": "stop_2",
+            "stop_name": "Oak Avenue",
+            "stop_sequence": 2,
+            "shape_dist": 1.5,
+            "timepoint": False,
+            "service_date": "2025-01-06",
+        }
+        assert doc[-1]["stop_id"] == "stop_3"
+
+    def test_getitem_matches_rows(self, doc: CsvDocument) -> None:
+        """Test that indexing agrees with the full rows list."""
+        rows = doc.rows
+        assert [doc[i] for i in range(len(doc))] == rows
+
+    def test_getitem_out_of_range_raises(self, doc: CsvDocument) -> None:
+        """Test that out-of-range row indexes raise IndexError."""
+        with pytest.raises(IndexError):
+            doc[3]
+        with pytest.raises(IndexError):
+            doc[-4]
+
+
+class TestJsonDocumentObject:
+    """Tests for indexing a JSON document with an object root."""
+
+    @pytest.fixture
+    def doc(self) -> JsonDocument:
+        return JsonDocument.from_string(SAMPLE_JSON)
+
+    def test_keys(self, doc: JsonDocument) -> None:
+        """Test that keys lists the root object's keys."""
+        assert sorted(doc.keys()) == ["active", "count", "missing", "name", "ratio", "stops"]
+
+    def test_len(self, doc: JsonDocument) -> None:
+        """Test that len counts the root object's keys."""
+        assert len(doc) == 6
+
+    def test_getitem_scalars(self, doc: JsonDocument) -> None:
+        """Test that scalar values convert to native Python types."""
+        assert doc["name"] == "Sample"
+        assert doc["count"] == 3
+        assert isinstance(doc["count"], int)
+        assert doc["ratio"] == 0.5
+        assert doc["active"] is True
+        assert doc["missing"] is None
+
+    def test_getitem_nested(self, doc: JsonDocument) -> None:
+        """Test that nested arrays and objects convert recursively."""
+        stops = doc["stops"]
+        assert stops == [
+            {"id": "stop_1", "coords": [51.5, -0.12]},
+            {"id": "stop_2", "coords": [51.6, -0.13]},
+        ]
+        assert doc["stops"][1]["id"] == "stop_2"
+
+    def test_getitem_matches_root(self, doc: JsonDocument) -> None:
+        """Test that indexing agrees with converting the whole root."""
+        root = doc.root
+        for key in doc.keys():
+            assert doc[key] == root[key]
+
+    def test_missing_key_raises(self, doc: JsonDocument) -> None:
+        """Test that a missing key raises KeyError."""
+        with pytest.raises(KeyError):
+            doc["nope"]
+
+
+class TestJsonDocumentArray:
+    """Tests for indexing a JSON document with an array root."""
+
+    @pytest.fixture
+    def doc(self) -> JsonDocument:
+        return JsonDocument.from_string('[1, "two", {"three": [3]}]')
+
+    def test_len(self, doc: JsonDocument) -> None:
+        """Test that len counts the root array's items."""
+        assert len(doc) == 3
+
+    def test_getitem(self, doc: JsonDocument) -> None:
+        """Test indexing the root array, including negative indexes."""
+        assert doc[0] == 1
+        assert doc[1] == "two"
+        assert doc[2] == {"three": [3]}
+        assert doc[-1] == {"three": [3]}
+
+    def test_out_of_range_raises(self, doc: JsonDocument) -> None:
+        """Test that out-of-range indexes raise IndexError."""
+        with pytest.raises(IndexError):
+            doc[3]
+        with pytest.raises(IndexError):
+            doc[-4]
+
+    def test_keys_requires_object(self, doc: JsonDocument) -> None:
+        """Test that keys raises TypeError for an array root."""
+        with pytest.raises(TypeError):
+            doc.keys()
+
+
+class TestJsonDocumentScalar:
+    """Tests for a JSON document with a scalar root."""
+
+    def test_len_and_getitem_raise(self) -> None:
+        """Test that a scalar root cannot be measured or indexed."""
+        doc = JsonDocument.from_string("42")
+        with pytest.raises(TypeError):
+            len(doc)
+        with pytest.raises(TypeError):
+            doc[0]
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from transit_parser import LazyGtfsFeed
 
 
 class TestLazyGtfsFeed:
@@ -12,15 +13,11 @@ class TestLazyGtfsFeed:
 
     def test_load_from_directory(self, gtfs_fixtures_dir: Path) -> None:
         """Test loading a lazy GTFS feed from a directory."""
-        from transit_parser import LazyGtfsFeed
-
         feed = LazyGtfsFeed.from_path(str(gtfs_fixtures_dir))
         assert feed is not None
 
     def test_lazy_loading_defers_parsing(self, gtfs_fixtures_dir: Path) -> None:
         """Test that lazy loading defers actual parsing until first access."""
-        from transit_parser import LazyGtfsFeed
-
         # This should be very fast (no parsing yet)
         feed = LazyGtfsFeed.from_path(str(gtfs_fixtures_dir))
 
@@ -91,13 +88,16 @@ class TestLazyGtfsFeed:
         assert regular_feed.stop_count == 5
         assert regular_feed.route_count == 3
 
-    def test_caching_after_first_access(self, sample_lazy_gtfs_feed) -> None:
+    def test_caching_after_first_access(self, gtfs_fixtures_dir: Path) -> None:
         """Test that data is cached after first access."""
+        # A fresh feed: the shared fixture may already have parsed agencies
+        feed = LazyGtfsFeed.from_path(str(gtfs_fixtures_dir))
+
         # First access triggers parsing
-        agencies1 = sample_lazy_gtfs_feed.agencies
+        agencies1 = feed.agencies
 
         # Second access should return cached data
-        agencies2 = sample_lazy_gtfs_feed.agencies
+        agencies2 = feed.agencies
 
         assert len(agencies1) == len(agencies2)
         ids1 = {a.id for a in agencies1}
@@ -110,7 +110,5 @@ class TestLazyGtfsFeedEdgeCases:
 
     def test_nonexistent_path_raises_error(self) -> None:
         """Test that loading from a nonexistent path raises an error."""
-        from transit_parser import LazyGtfsFeed
-
         with pytest.raises(Exception):
             LazyGtfsFeed.from_path("/nonexistent/path")
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from transit_parser import TxcDocument
 
 
 class TestTxcDocument:
@@ -12,8 +13,6 @@ class TestTxcDocument:
 
     def test_load_from_file(self, txc_fixtures_dir: Path) -> None:
         """Test loading a TXC document from a file."""
-        from transit_parser import TxcDocument
-
         txc_file = txc_fixtures_dir / "sample_service.xml"
         doc = TxcDocument.from_path(str(txc_file))
         assert doc is not None
@@ -71,15 +70,11 @@ class TestTxcDocumentEdgeCases:
 
     def test_nonexistent_path_raises_error(self) -> None:
         """Test that loading from a nonexistent path raises an error."""
-        from transit_parser import TxcDocument
-
         with pytest.raises(Exception):
             TxcDocument.from_path("/nonexistent/path")
 
     def test_invalid_xml_returns_empty_document(self, tmp_path: Path) -> None:
         """Test that loading invalid XML returns an empty document."""
-        from transit_parser import TxcDocument
-
         invalid_file = tmp_path / "invalid.xml"
         invalid_file.write_text("this is not valid xml")
 
@@ -91,8 +86,6 @@ class TestTxcDocumentEdgeCases:
 
     def test_empty_xml_returns_empty_document(self, tmp_path: Path) -> None:
         """Test that loading empty XML returns an empty document."""
-        from transit_parser import TxcDocument
-
         empty_file = tmp_path / "empty.xml"
         empty_file.write_text("")
 
@@ -107,8 +100,6 @@ class TestTxcDocumentFromString:
 
     def test_from_string(self) -> None:
         """Test loading TXC document from string."""
-        from transit_parser import TxcDocument
-
         xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
 <TransXChange xmlns="http://www.transxchange.org.uk/" SchemaVersion="2.4">
   <Operators>